@@ -1,14 +1,15 @@
 """Consistency checker for property listings."""
 
-import json
 from datetime import datetime
 from typing import Any
 
+import orjson
 from apify import Actor
 
-from src.llm_service import check_consistency_with_llm
+from src.llm_service import cache_llm_response, check_consistency_with_llm, extract_content_from_llm_response
 from src.mock_data import generate_mock_result_for_property
 from src.models import ConsistencyCheckResult, InconsistencyFinding, SeverityLevel
+from src.utils import generate_listing_id_from_url, log_error
 
 
 async def check_property_consistency(
@@ -51,12 +52,12 @@ async def check_property_consistency(
             temperature=temperature,
         )
         
-        if llm_result and 'choices' in llm_result and len(llm_result['choices']) > 0:
-            content = llm_result['choices'][0].get('message', {}).get('content', '')
+        if llm_result and llm_result.get('choices'):
+            content = extract_content_from_llm_response(llm_result) or ''
             
             try:
                 # Try to parse LLM response as JSON
-                analysis = json.loads(content)
+                analysis = orjson.loads(content)
                 inconsistencies = analysis.get('inconsistencies', [])
                 
                 # Convert LLM inconsistencies to InconsistencyFinding objects
@@ -80,7 +81,6 @@ async def check_property_consistency(
                     )
                 
                 # Generate listing ID from URL
-                from src.utils import generate_listing_id_from_url
                 listing_id = generate_listing_id_from_url(url)
                 
                 result = ConsistencyCheckResult(
@@ -94,9 +94,10 @@ async def check_property_consistency(
                 )
                 
                 Actor.log.info(f'LLM consistency check completed: {len(findings)} inconsistencies found')
+                await cache_llm_response(llm_result, content)
                 return result
                 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 Actor.log.warning('LLM response was not valid JSON, falling back to mock data')
                 # Fall through to mock data generation
         
@@ -105,7 +106,7 @@ async def check_property_consistency(
             # Fall through to mock data generation
             
     except Exception as e:
-        Actor.log.exception(f'Error during LLM consistency check: {e}')
+        log_error('Error during LLM consistency check: %s', e)
         Actor.log.warning('Falling back to mock data due to LLM error')
         # Fall through to mock data generation
     
@@ -1,6 +1,9 @@
 """LLM service for property analysis."""
 
+import asyncio
+import hashlib
 import json
+import logging
 import os
 import re
 from typing import Any
@@ -9,6 +12,38 @@ from openai import AsyncOpenAI
 
 from apify import Actor
 from src.models import ListingInput, ConsistencyCheckResult
+from src.utils import generate_listing_id_from_url, log_error
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Precompiled patterns for parsing numbers out of scraped text
+_RE_INT = re.compile(r'\d+')
+_RE_FLOAT = re.compile(r'\d+\.?\d*')
+
+OPENROUTER_BASE_URL = "https://openrouter.apify.actor/api/v1"
+# The client retries requests that fail before the response starts; a response stream
+# that breaks off while it is being read is requested again up to this many times
+LLM_STREAM_RETRIES = 2
+
+# JSON mode for prompts that ask for free-form JSON without a schema
+JSON_OBJECT_RESPONSE_FORMAT = {"type": "json_object"}
+
+# APIFY_TOKEN doesn't change during a run, so it is resolved once
+_apify_token: str | None = None
+
+# One client per APIFY_TOKEN so connections (and TLS sessions) are reused across calls
+_openrouter_clients: dict[str, AsyncOpenAI] = {}
+
+# Named key-value store that keeps LLM responses between runs (only when enabled)
+LLM_CACHE_STORE_NAME = "llm-response-cache"
+# Only near-deterministic requests are cached; at higher temperatures a retry should resample
+LLM_CACHE_MAX_TEMPERATURE = 0.1
+# In-process front cache of LLM responses, keyed like the key-value store records.
+# It holds at most LLM_CACHE_MAX_ENTRIES responses; the oldest are dropped first.
+LLM_CACHE_MAX_ENTRIES = 1024
+_llm_response_cache: dict[str, dict[str, Any]] = {}
+# Whether responses are also read from and written to the persistent key-value store
+_persist_llm_responses = False
 
 
 def sanitize_json_schema_for_llm(schema: dict[str, Any]) -> dict[str, Any]:
@@ -91,6 +126,237 @@ def sanitize_json_schema_for_llm(schema: dict[str, Any]) -> dict[str, Any]:
     return sanitized
 
 
+def get_apify_token() -> str | None:
+    """Get the APIFY_TOKEN used for OpenRouter calls, resolving it on first use.
+    
+    Returns:
+        Apify API token, or None if it isn't set
+    """
+    global _apify_token
+    if _apify_token:
+        return _apify_token
+    
+    # Get APIFY_TOKEN - use Actor's environment (works with apify run)
+    apify_token = None
+    try:
+        env = Actor.get_env()
+        apify_token = env.get("APIFY_TOKEN") if env else None
+    except Exception as e:
+        Actor.log.debug(f"Could not get APIFY_TOKEN from Actor.get_env(): {e}")
+    
+    # Fallback to os.getenv (works with direct python execution and .env file)
+    if not apify_token:
+        apify_token = os.getenv("APIFY_TOKEN")
+    
+    # A missing token isn't cached, so setting it later still takes effect
+    _apify_token = apify_token or None
+    return _apify_token
+
+
+def get_openrouter_client(apify_token: str) -> AsyncOpenAI:
+    """Get the shared OpenRouter client for the given token, creating it on first use.
+    
+    Args:
+        apify_token: Apify API token used for authentication
+    
+    Returns:
+        AsyncOpenAI client whose connection pool is reused between calls
+    """
+    client = _openrouter_clients.get(apify_token)
+    if client is None:
+        # LLM calls can take 10-30+ seconds, especially with structured outputs,
+        # so use a 60 second timeout instead of the default 10 minutes
+        client = AsyncOpenAI(
+            base_url=OPENROUTER_BASE_URL,
+            api_key="no-key-required-but-must-not-be-empty",
+            default_headers={
+                "Authorization": f"Bearer {apify_token}",
+            },
+            timeout=60.0,  # 60 second timeout for read operations (LLM responses can be slow)
+            max_retries=3,  # Allow up to 3 retries on transient failures
+        )
+        _openrouter_clients[apify_token] = client
+    return client
+
+
+async def close_openrouter_clients() -> None:
+    """Close all shared OpenRouter clients and their connection pools."""
+    clients = list(_openrouter_clients.values())
+    _openrouter_clients.clear()
+    for client in clients:
+        await client.close()
+
+
+def set_persistent_llm_cache(enabled: bool) -> None:
+    """Enable or disable keeping LLM responses in the persistent key-value store.
+    
+    Args:
+        enabled: Whether responses are shared between runs via LLM_CACHE_STORE_NAME
+    """
+    global _persist_llm_responses
+    _persist_llm_responses = enabled
+
+
+def get_llm_cache_key(
+    messages: list[dict[str, str]],
+    model: str,
+    temperature: float,
+    response_format: dict[str, Any] | None,
+) -> str:
+    """Build the cache key identifying an LLM request.
+    
+    Args:
+        messages: Request messages
+        model: Model identifier
+        temperature: Sampling temperature
+        response_format: Response format of the request, if any
+    
+    Returns:
+        Key-value store key derived from a hash of the whole request
+    """
+    request = json.dumps(
+        {"messages": messages, "model": model, "temperature": temperature, "response_format": response_format},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return f"llm-{hashlib.sha256(request.encode()).hexdigest()}"
+
+
+def remember_llm_response(cache_key: str, response: dict[str, Any]) -> None:
+    """Store a response in the in-process cache, dropping the oldest entries beyond its size limit.
+    
+    Args:
+        cache_key: Key from get_llm_cache_key
+        response: Response dict in the call_openrouter_llm format
+    """
+    _llm_response_cache[cache_key] = response
+    while len(_llm_response_cache) > LLM_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order, so the first key is the oldest
+        del _llm_response_cache[next(iter(_llm_response_cache))]
+
+
+async def get_cached_llm_response(cache_key: str) -> dict[str, Any] | None:
+    """Get a cached LLM response from memory or the persistent key-value store.
+    
+    Args:
+        cache_key: Key from get_llm_cache_key
+    
+    Returns:
+        Response dict in the call_openrouter_llm format, or None on a cache miss
+    """
+    cached = _llm_response_cache.get(cache_key)
+    if cached is not None or not _persist_llm_responses:
+        return cached
+    
+    try:
+        store = await Actor.open_key_value_store(name=LLM_CACHE_STORE_NAME)
+        cached = await store.get_value(cache_key)
+    except Exception as e:
+        Actor.log.debug("Could not read LLM response cache: %s", e)
+        return None
+    
+    if cached is not None:
+        remember_llm_response(cache_key, cached)
+    return cached
+
+
+async def cache_llm_response(llm_result: dict[str, Any] | None, content: str) -> None:
+    """Cache the content of an LLM response once the caller has parsed and validated it.
+    
+    Responses that were served from the cache or aren't cacheable carry no 'cache_key'
+    and are skipped, so rejected content is never replayed.
+    
+    Args:
+        llm_result: Response dict returned by call_openrouter_llm
+        content: Validated response content to cache
+    """
+    cache_key = llm_result.get("cache_key") if llm_result else None
+    if not cache_key:
+        return
+    # Only the content is kept, in the dict shape extract_content_from_llm_response reads
+    response = {"choices": [{"message": {"role": "assistant", "content": content}}]}
+    remember_llm_response(cache_key, response)
+    if not _persist_llm_responses:
+        return
+    try:
+        store = await Actor.open_key_value_store(name=LLM_CACHE_STORE_NAME)
+        await store.set_value(cache_key, response)
+    except Exception as e:
+        Actor.log.debug("Could not write LLM response cache: %s", e)
+
+
+async def collect_streamed_message(stream: Any) -> dict[str, Any]:
+    """Assemble the first choice of a streamed chat completion into a message dict.
+    
+    Args:
+        stream: Async iterator of chat completion chunks
+    
+    Returns:
+        Message dict with 'role', 'content' and, if the model used them, 'tool_calls'
+        and 'refusal' (the shape extract_content_from_llm_response reads)
+    """
+    role = "assistant"
+    content_parts: list[str] = []
+    refusal_parts: list[str] = []
+    # Tool call arguments arrive in pieces, keyed by the tool call index
+    tool_calls: dict[int, dict[str, Any]] = {}
+    
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        if delta is None:
+            continue
+        if delta.role:
+            role = delta.role
+        if delta.content:
+            content_parts.append(delta.content)
+        if getattr(delta, "refusal", None):
+            refusal_parts.append(delta.refusal)
+        for tool_call in delta.tool_calls or ():
+            function = tool_calls.setdefault(tool_call.index, {"name": None, "arguments": []})
+            if tool_call.function is not None:
+                if tool_call.function.name:
+                    function["name"] = tool_call.function.name
+                if tool_call.function.arguments:
+                    function["arguments"].append(tool_call.function.arguments)
+    
+    message: dict[str, Any] = {"role": role, "content": "".join(content_parts) or None}
+    if refusal_parts:
+        message["refusal"] = "".join(refusal_parts)
+    if tool_calls:
+        message["tool_calls"] = [
+            {"function": {"name": function["name"], "arguments": "".join(function["arguments"]) or None}}
+            for _, function in sorted(tool_calls.items())
+        ]
+    return message
+
+
+async def request_streamed_message(client: AsyncOpenAI, request_params: dict[str, Any]) -> dict[str, Any]:
+    """Request a streamed chat completion and assemble its message.
+    
+    Args:
+        client: OpenRouter client
+        request_params: Chat completion parameters (without 'stream')
+    
+    Returns:
+        Message dict as returned by collect_streamed_message
+    """
+    attempt = 0
+    while True:
+        stream = await client.chat.completions.create(**request_params, stream=True)
+        try:
+            # Closing the stream releases its connection back to the pool
+            async with stream:
+                return await collect_streamed_message(stream)
+        except Exception as e:
+            attempt += 1
+            if attempt > LLM_STREAM_RETRIES:
+                raise
+            Actor.log.warning(f"LLM response stream broke off ({type(e).__name__}: {e}), retrying")
+            await asyncio.sleep(attempt)
+
+
 async def call_openrouter_llm(
     messages: list[dict[str, str]],
     model: str = "openrouter/openai/gpt-5-mini",
@@ -108,20 +374,21 @@ async def call_openrouter_llm(
         temperature: Sampling temperature (0.0-2.0)
     
     Returns:
-        Response dict with 'choices' containing the LLM response, or None on error
+        Response dict with 'choices' containing the assembled message, or None on error.
+        Fresh responses to cacheable requests also carry the 'cache_key' for cache_llm_response.
     """
+    # Identical near-deterministic requests (e.g., re-running the same listings) are
+    # answered from the cache
+    cache_key = None
+    if temperature <= LLM_CACHE_MAX_TEMPERATURE:
+        cache_key = get_llm_cache_key(messages, model, temperature, response_format)
+        cached = await get_cached_llm_response(cache_key)
+        if cached is not None:
+            Actor.log.info(f"Using cached LLM response for model: {model}")
+            return cached
+    
     try:
-        # Get APIFY_TOKEN - use Actor's environment (works with apify run)
-        apify_token = None
-        try:
-            env = Actor.get_env()
-            apify_token = env.get("APIFY_TOKEN") if env else None
-        except Exception as e:
-            Actor.log.debug(f"Could not get APIFY_TOKEN from Actor.get_env(): {e}")
-        
-        # Fallback to os.getenv (works with direct python execution and .env file)
-        if not apify_token:
-            apify_token = os.getenv("APIFY_TOKEN")
+        apify_token = get_apify_token()
         
         if not apify_token:
             Actor.log.error("APIFY_TOKEN not found. Make sure it's set in your environment or .env file")
@@ -130,35 +397,26 @@ async def call_openrouter_llm(
         # Log the messages being sent to the LLM
         Actor.log.info(f"Calling OpenRouter actor via OpenAI client with model: {model}")
         Actor.log.info(f"Temperature: {temperature}")
-        Actor.log.debug("=" * 80)
-        Actor.log.debug("LLM REQUEST MESSAGES:")
-        Actor.log.debug("=" * 80)
-        for i, msg in enumerate(messages, 1):
-            role = msg.get('role', 'unknown')
-            content = msg.get('content', '')
-            # Truncate very long content for readability
-            content_preview = content[:500] + "..." if len(content) > 500 else content
-            Actor.log.debug(f"Message {i} [{role}]:")
-            Actor.log.debug(content_preview)
-            if len(content) > 500:
-                Actor.log.debug(f"... (truncated, total length: {len(content)} characters)")
-        Actor.log.debug("=" * 80)
-        if response_format:
-            Actor.log.debug(f"Response format: {json.dumps(response_format, indent=2)}")
+        # Previews are only built when DEBUG logging is enabled
+        if Actor.log.isEnabledFor(logging.DEBUG):
+            Actor.log.debug("=" * 80)
+            Actor.log.debug("LLM REQUEST MESSAGES:")
+            Actor.log.debug("=" * 80)
+            for i, msg in enumerate(messages, 1):
+                role = msg.get('role', 'unknown')
+                content = msg.get('content', '')
+                # Truncate very long content for readability
+                content_preview = content[:500] + "..." if len(content) > 500 else content
+                Actor.log.debug(f"Message {i} [{role}]:")
+                Actor.log.debug(content_preview)
+                if len(content) > 500:
+                    Actor.log.debug(f"... (truncated, total length: {len(content)} characters)")
+            Actor.log.debug("=" * 80)
+            if response_format:
+                Actor.log.debug(f"Response format: {json.dumps(response_format, indent=2)}")
         
-        # Initialize OpenAI client with longer timeout for LLM calls
-        # LLM calls can take 10-30+ seconds, especially with structured outputs
-        # Using a tuple for (connect timeout, read timeout, write timeout, pool timeout)
-        # Default OpenAI timeout is 5 minutes, but we'll use 60 seconds for read timeout
-        client = AsyncOpenAI(
-            base_url="https://openrouter.apify.actor/api/v1",
-            api_key="no-key-required-but-must-not-be-empty",
-            default_headers={
-                "Authorization": f"Bearer {apify_token}",
-            },
-            timeout=60.0,  # 60 second timeout for read operations (LLM responses can be slow)
-            max_retries=3,  # Allow up to 3 retries on transient failures
-        )
+        # Reuse the shared client (keeps connections alive between calls)
+        client = get_openrouter_client(apify_token)
         
         # Prepare request parameters
         request_params = {
@@ -172,10 +430,13 @@ async def call_openrouter_llm(
             request_params["response_format"] = response_format
         
         # Call the LLM using OpenAI chat completions API
-        # The OpenAI client will automatically retry on transient failures
-        # with exponential backoff (handled by the client library)
+        # The OpenAI client will automatically retry requests that fail before the
+        # response starts, with exponential backoff (handled by the client library);
+        # a stream that breaks off mid-response is retried by request_streamed_message.
+        # The response is streamed, so the 60 second read timeout applies between
+        # chunks rather than to the whole generation of a long structured output.
         try:
-            completion = await client.chat.completions.create(**request_params)
+            message = await request_streamed_message(client, request_params)
         except Exception as e:
             # Log the error with context
             Actor.log.warning(f"LLM API call failed: {type(e).__name__}: {e}")
@@ -183,49 +444,26 @@ async def call_openrouter_llm(
             # Re-raise to let the outer try-except handle it
             raise
         
-        # Log response summary
-        Actor.log.debug("=" * 80)
-        Actor.log.debug("LLM RESPONSE:")
-        Actor.log.debug("=" * 80)
-        if completion.choices:
-            choice = completion.choices[0]
-            if hasattr(choice, 'message'):
-                role = choice.message.role if hasattr(choice.message, 'role') else 'unknown'
-                content = choice.message.content if hasattr(choice.message, 'content') else None
-                if content:
-                    content_preview = content[:500] + "..." if len(content) > 500 else content
-                    Actor.log.debug(f"Response [{role}]:")
-                    Actor.log.debug(content_preview)
-                    if len(content) > 500:
-                        Actor.log.debug(f"... (truncated, total length: {len(content)} characters)")
-                else:
-                    Actor.log.debug("Response: (no content, possibly structured output)")
-        Actor.log.debug("=" * 80)
+        # Log response summary (only built when DEBUG logging is enabled)
+        if Actor.log.isEnabledFor(logging.DEBUG):
+            Actor.log.debug("=" * 80)
+            Actor.log.debug("LLM RESPONSE:")
+            Actor.log.debug("=" * 80)
+            content = message["content"]
+            if content:
+                content_preview = content[:500] + "..." if len(content) > 500 else content
+                Actor.log.debug(f"Response [{message['role']}]:")
+                Actor.log.debug(content_preview)
+                if len(content) > 500:
+                    Actor.log.debug(f"... (truncated, total length: {len(content)} characters)")
+            else:
+                Actor.log.debug("Response: (no content, possibly structured output)")
+            Actor.log.debug("=" * 80)
         
-        # Convert response to dict format
-        # Handle structured outputs - content may be in message.content or elsewhere
-        result = {
-            "choices": []
-        }
-        for choice in completion.choices:
-            choice_dict = {
-                "message": {
-                    "role": choice.message.role,
-                    "content": choice.message.content if hasattr(choice.message, 'content') else None,
-                }
-            }
-            # Check for tool_calls (some models use this for structured outputs)
-            if hasattr(choice.message, 'tool_calls') and choice.message.tool_calls:
-                choice_dict["message"]["tool_calls"] = [
-                    {
-                        "function": {
-                            "name": tc.function.name if hasattr(tc.function, 'name') else None,
-                            "arguments": tc.function.arguments if hasattr(tc.function, 'arguments') else None,
-                        }
-                    }
-                    for tc in choice.message.tool_calls
-                ]
-            result["choices"].append(choice_dict)
+        result: dict[str, Any] = {"choices": [{"message": message}]}
+        if cache_key:
+            # The caller stores the content with cache_llm_response once it has validated it
+            result["cache_key"] = cache_key
         
         Actor.log.info("Successfully received response from OpenRouter")
         return result
@@ -252,7 +490,7 @@ async def call_openrouter_llm(
                 "The OpenAI client handles retries automatically."
             )
         else:
-            Actor.log.exception(f"Error calling OpenRouter actor: {e}")
+            log_error("Error calling OpenRouter actor: %s", e)
         return None
 
 
@@ -311,6 +549,7 @@ Respond in JSON format with keys: summary, sellingPoints (array), concerns (arra
         messages=messages,
         model=model,
         temperature=temperature,
+        response_format=JSON_OBJECT_RESPONSE_FORMAT,
     )
 
 
@@ -365,6 +604,7 @@ Respond in JSON format with keys: inconsistencies (array of objects with field_n
         messages=messages,
         model=model,
         temperature=temperature,
+        response_format=JSON_OBJECT_RESPONSE_FORMAT,
     )
 
 
@@ -372,15 +612,21 @@ def extract_number_from_text(text: str | None) -> int | None:
     """Extract first number from text string."""
     if not text:
         return None
-    match = re.search(r'\d+', str(text))
+    match = _RE_INT.search(str(text))
     return int(match.group()) if match else None
 
 
+def strip_non_numeric(text: str) -> str:
+    """Keep only the digits and decimal points of a string (e.g., "8 499 000 Kč" -> "8499000")."""
+    # A plain character filter beats re.sub for short price strings
+    return ''.join([char for char in text if char.isdecimal() or char == '.'])
+
+
 def extract_float_from_text(text: str | None) -> float | None:
     """Extract first float number from text string."""
     if not text:
         return None
-    match = re.search(r'\d+\.?\d*', str(text))
+    match = _RE_FLOAT.search(str(text))
     return float(match.group()) if match else None
 
 
@@ -393,17 +639,19 @@ def extract_content_from_llm_response(llm_result: dict[str, Any]) -> str | None:
     Returns:
         Content string from the response, or None if not found
     """
-    if not llm_result or 'choices' not in llm_result or len(llm_result['choices']) == 0:
+    choices = llm_result.get('choices') if llm_result else None
+    if not choices:
         return None
     
-    choice = llm_result['choices'][0]
+    choice = choices[0]
     content = None
-    message = choice.get('message', {}) if isinstance(choice, dict) else getattr(choice, 'message', {})
+    message = (choice.get('message') or {}) if isinstance(choice, dict) else getattr(choice, 'message', {})
     
     if isinstance(message, dict):
         # Check for refusal
-        if message.get('refusal'):
-            Actor.log.warning(f"LLM refused request: {message.get('refusal')}")
+        refusal = message.get('refusal')
+        if refusal:
+            Actor.log.warning(f"LLM refused request: {refusal}")
             return None
         
         # Get content from message dict
@@ -444,10 +692,18 @@ def parse_json_content(content: str | Any) -> dict[str, Any] | None:
     """
     if isinstance(content, str):
         try:
-            return json.loads(content)
+            # Bare JSON (the usual case with JSON mode) is decoded from its start; otherwise
+            # decode from the first object brace so that prose or markdown fences around
+            # the JSON (and anything after it) are skipped in a single scan
+            body = content.lstrip()
+            start = len(content) - len(body) if body[:1] in ('{', '[') else content.find('{')
+            if start < 0:
+                raise json.JSONDecodeError("No JSON object found", content, 0)
+            parsed, _ = _JSON_DECODER.raw_decode(content, start)
+            return parsed
         except json.JSONDecodeError as e:
             Actor.log.warning(f"Failed to parse JSON from LLM response: {e}")
-            Actor.log.debug(f"Content length: {len(content)}")
+            Actor.log.debug("Content length: %d", len(content))
             
             # Check if JSON appears truncated
             if '"findings"' in content:
@@ -476,11 +732,12 @@ def parse_json_content(content: str | Any) -> dict[str, Any] | None:
                         pass
             
             # Log content for debugging
-            if len(content) > 1000:
-                Actor.log.debug(f"First 500 chars: {content[:500]}")
-                Actor.log.debug(f"Last 500 chars: {content[-500:]}")
-            else:
-                Actor.log.debug(f"Full content: {content}")
+            if Actor.log.isEnabledFor(logging.DEBUG):
+                if len(content) > 1000:
+                    Actor.log.debug(f"First 500 chars: {content[:500]}")
+                    Actor.log.debug(f"Last 500 chars: {content[-500:]}")
+                else:
+                    Actor.log.debug(f"Full content: {content}")
             return None
     else:
         return content
@@ -531,7 +788,7 @@ async def convert_scraped_data_to_listing_input(
     price_value = None
     if price_str:
         # Remove all spaces and non-digit characters except decimal point
-        price_clean = re.sub(r'[^\d.]', '', price_str.replace(' ', '').replace('​', ''))
+        price_clean = strip_non_numeric(price_str)
         if price_clean:
             try:
                 price_value = float(price_clean)
@@ -542,7 +799,7 @@ async def convert_scraped_data_to_listing_input(
     if not price_value:
         price_per_m2 = property_details.get('pricePerM2') or property_data.get('attributes', {}).get('Cena za jednotku', '')
         if price_per_m2:
-            price_clean = re.sub(r'[^\d.]', '', str(price_per_m2).replace(' ', '').replace('​', ''))
+            price_clean = strip_non_numeric(str(price_per_m2))
             if price_clean:
                 try:
                     price_per_m2_value = float(price_clean)
@@ -553,7 +810,6 @@ async def convert_scraped_data_to_listing_input(
                     pass
     
     # Generate listing ID from URL
-    from src.utils import generate_listing_id_from_url
     url = property_data.get('url', '')
     listing_id = generate_listing_id_from_url(url)
     
@@ -688,13 +944,13 @@ Always return valid JSON matching the schema exactly with all constraints satisf
             # Always add if available, even if LLM didn't include them
             if kebab_index is not None:
                 listing_data['district_kebab_index'] = float(kebab_index)
-                Actor.log.debug(f"Added district_kebab_index: {kebab_index:.2f}")
+                Actor.log.debug("Added district_kebab_index: %.2f", kebab_index)
             if violent_crimes_rate is not None:
                 listing_data['district_violent_crimes_rate'] = float(violent_crimes_rate)
-                Actor.log.debug(f"Added district_violent_crimes_rate: {violent_crimes_rate:.2f}")
+                Actor.log.debug("Added district_violent_crimes_rate: %.2f", violent_crimes_rate)
             if burglaries_rate is not None:
                 listing_data['district_burglaries_rate'] = float(burglaries_rate)
-                Actor.log.debug(f"Added district_burglaries_rate: {burglaries_rate:.2f}")
+                Actor.log.debug("Added district_burglaries_rate: %.2f", burglaries_rate)
         
         # Validate and fix data before creating ListingInput
         # Fix list_price if invalid (must be > 0)
@@ -708,7 +964,7 @@ Always return valid JSON matching the schema exactly with all constraints satisf
                 # Calculate from price per m² if available
                 price_per_m2 = property_details.get('pricePerM2') or property_data.get('attributes', {}).get('Cena za jednotku', '')
                 if price_per_m2 and area_sqm:
-                    price_clean = re.sub(r'[^\d.]', '', str(price_per_m2).replace(' ', '').replace('​', ''))
+                    price_clean = strip_non_numeric(str(price_per_m2))
                     if price_clean:
                         try:
                             price_per_m2_value = float(price_clean)
@@ -756,14 +1012,15 @@ Always return valid JSON matching the schema exactly with all constraints satisf
         try:
             listing_input = ListingInput(**listing_data)
             Actor.log.info(f"Successfully converted to ListingInput: {listing_input.listing_id}")
+            await cache_llm_response(llm_result, content)
             return listing_input
         except Exception as e:
-            Actor.log.exception(f"Failed to create ListingInput from LLM response: {e}")
-            Actor.log.debug(f"LLM response data: {listing_data}")
+            log_error("Failed to create ListingInput from LLM response: %s", e)
+            Actor.log.debug("LLM response data: %s", listing_data)
             return None
             
     except Exception as e:
-        Actor.log.exception(f"Error converting scraped data to ListingInput: {e}")
+        log_error("Error converting scraped data to ListingInput: %s", e)
         return None
 
 
@@ -940,8 +1197,8 @@ OUTPUT REQUIREMENTS:
             return None
         
         # Log full content for debugging if parsing fails
-        Actor.log.debug(f"LLM response content length: {len(content) if content else 0} characters")
-        if content and len(content) > 2000:
+        Actor.log.debug("LLM response content length: %d characters", len(content))
+        if len(content) > 2000 and Actor.log.isEnabledFor(logging.DEBUG):
             Actor.log.debug(f"Content preview (first 500 chars): {content[:500]}")
             Actor.log.debug(f"Content preview (last 500 chars): {content[-500:]}")
         
@@ -955,54 +1212,26 @@ OUTPUT REQUIREMENTS:
                 Actor.log.error(f"Content end: {content[-300:] if len(content) > 300 else content}")
             return None
         
-        # Validate and fix data before creating ConsistencyCheckResult
-        # Ensure required fields are present
-        if 'listing_id' not in consistency_data:
-            consistency_data['listing_id'] = listing_input.listing_id
-        if 'property_address' not in consistency_data:
-            consistency_data['property_address'] = listing_input.property_address
-        
-        # Ensure checked_at is set if not provided
-        if 'checked_at' not in consistency_data:
-            from datetime import datetime
-            consistency_data['checked_at'] = datetime.now().isoformat()
-        
-        # Ensure findings is a list
-        if 'findings' not in consistency_data:
-            consistency_data['findings'] = []
-        elif not isinstance(consistency_data['findings'], list):
-            Actor.log.warning("Findings is not a list, converting...")
-            consistency_data['findings'] = []
-        
-        # Ensure total_inconsistencies is set and reasonable
-        findings_count = len(consistency_data.get('findings', []))
-        if 'total_inconsistencies' not in consistency_data:
-            consistency_data['total_inconsistencies'] = findings_count
-        elif consistency_data['total_inconsistencies'] != findings_count:
-            # If there's a mismatch, use the actual findings count (more reliable)
-            Actor.log.warning(f"total_inconsistencies ({consistency_data['total_inconsistencies']}) doesn't match findings count ({findings_count}), using findings count")
-            consistency_data['total_inconsistencies'] = findings_count
-        
-        # Ensure is_consistent is set
-        if 'is_consistent' not in consistency_data:
-            consistency_data['is_consistent'] = len(consistency_data.get('findings', [])) == 0
-        
-        # Ensure summary is present
-        if 'summary' not in consistency_data or not consistency_data['summary']:
-            num_findings = len(consistency_data.get('findings', []))
-            consistency_data['summary'] = f"Found {num_findings} inconsistency(ies)" if num_findings > 0 else "No inconsistencies found"
-        
-        # Create ConsistencyCheckResult from parsed data
+        # Create ConsistencyCheckResult from parsed data; missing fields are
+        # defaulted by the model's validator using the listing as context
         try:
-            consistency_result = ConsistencyCheckResult(**consistency_data)
+            consistency_result = ConsistencyCheckResult.model_validate(
+                consistency_data,
+                context={
+                    'listing_id': listing_input.listing_id,
+                    'property_address': listing_input.property_address,
+                },
+            )
             Actor.log.info(f"Successfully created ConsistencyCheckResult: {consistency_result.total_inconsistencies} inconsistencies found")
+            await cache_llm_response(llm_result, content)
             return consistency_result
         except Exception as e:
-            Actor.log.exception(f"Failed to create ConsistencyCheckResult from LLM response: {e}")
-            Actor.log.debug(f"LLM response data keys: {list(consistency_data.keys())}")
-            Actor.log.debug(f"LLM response data (first 500 chars): {str(consistency_data)[:500]}")
+            log_error("Failed to create ConsistencyCheckResult from LLM response: %s", e)
+            if Actor.log.isEnabledFor(logging.DEBUG):
+                Actor.log.debug(f"LLM response data keys: {list(consistency_data.keys())}")
+                Actor.log.debug(f"LLM response data (first 500 chars): {str(consistency_data)[:500]}")
             return None
             
     except Exception as e:
-        Actor.log.exception(f"Error checking consistency with structured outputs: {e}")
+        log_error("Error checking consistency with structured outputs: %s", e)
         return None
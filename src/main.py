@@ -6,77 +6,167 @@ analyzes them with LLM, and checks for consistency issues.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+from datetime import datetime
 from typing import Any
 
 from apify import Actor
-from crawlee.crawlers import PlaywrightCrawler, PlaywrightCrawlingContext
+from crawlee import ConcurrencySettings, Request
+from crawlee.crawlers import (
+    BasicCrawlingContext,
+    HttpCrawler,
+    HttpCrawlingContext,
+    PlaywrightCrawler,
+    PlaywrightCrawlingContext,
+    PlaywrightPreNavCrawlingContext,
+)
 
 from src.consistency_checker import check_property_consistency
 from src.llm_service import (
-    analyze_property_with_llm,
+    close_openrouter_clients,
     convert_scraped_data_to_listing_input,
     check_consistency_with_structured_output,
+    set_persistent_llm_cache,
 )
 from src.mock_data import generate_mock_inconsistency_results, generate_mock_result_for_property
 from src.models import ConsistencyCheckResult
-from src.scraper_service import extract_property_data, handle_consent_page
+from src.scraper_service import (
+    decode_html,
+    extract_property_data,
+    extract_property_data_from_html,
+    handle_consent_page,
+)
+from src.utils import log_error
+
+
+# Scraped properties are analyzed in batches of up to this many concurrent LLM pipelines
+LLM_BATCH_SIZE = 8
+# How long to wait for more scraped properties before sending a partial batch
+LLM_BATCH_WAIT_SECONDS = 0.25
+# Dataset items are pushed once at least this many have been buffered
+PUSH_BATCH_SIZE = 50
+# Browser tabs rendered in parallel by the Playwright fallback, all in one shared browser
+MAX_PARALLEL_PAGES = 5
+# The browser fallback waits for the content is_property_page_rendered checks before
+# extracting: the listing title and a parameter table row (the extractor's two-cell rows)
+PROPERTY_CONTENT_SELECTORS = ('h1', 'xpath=//tr[count(.//td)=2]')
+PROPERTY_CONTENT_TIMEOUT_MS = 8000
+# The extractor only reads the HTML, so the browser fallback doesn't download these
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+BLOCKED_URL_PARTS = ('googletagmanager', 'google-analytics', 'doubleclick', 'facebook.net', 'hotjar')
+
+
+def mock_results_fallback_data() -> list[dict[str, Any]]:
+    """Get mock inconsistency results as dataset items."""
+    return [result.model_dump(mode='json') for result in generate_mock_inconsistency_results()]
 
 
-async def push_mock_results_fallback(context: PlaywrightCrawlingContext | None = None) -> None:
+async def push_mock_results_fallback(
+    context: PlaywrightCrawlingContext | HttpCrawlingContext | None = None,
+) -> None:
     """Push mock inconsistency results as fallback when processing fails.
     
     Args:
-        context: Playwright crawling context (if available), otherwise uses Actor.push_data
+        context: Crawling context (if available), otherwise uses Actor.push_data
     """
-    mock_results = generate_mock_inconsistency_results()
-    for result in mock_results:
-        if context:
-            await context.push_data(result.model_dump(mode='json'))
-        else:
-            await Actor.push_data(result.model_dump(mode='json'))
+    mock_results = mock_results_fallback_data()
+    if context:
+        await context.push_data(mock_results)
+    else:
+        await Actor.push_data(mock_results)
 
 
-async def process_property(
+def log_structured_output(title: str, data: dict[str, Any]) -> None:
+    """Log a structured LLM output as a single pretty-printed record.
+    
+    Args:
+        title: Heading shown above the data
+        data: JSON-serializable output to log
+    """
+    # Skip the JSON formatting entirely when INFO logging is disabled
+    if Actor.log.isEnabledFor(logging.INFO):
+        separator = '=' * 80
+        formatted = json.dumps(data, indent=2, ensure_ascii=False)
+        Actor.log.info('\n'.join((separator, title, separator, formatted, separator)))
+
+
+def is_property_page_rendered(property_data: dict[str, Any]) -> bool:
+    """Check whether the HTML contained the listing content (title and parameter table).
+    
+    Pages where it is missing were probably rendered client-side and need a browser.
+    """
+    return bool(property_data.get('title') and property_data.get('attributes'))
+
+
+async def block_unneeded_requests(route: Any) -> None:
+    """Abort browser requests for resources the extractor never reads.
+    
+    Args:
+        route: Playwright route of the intercepted request
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in request.url for part in BLOCKED_URL_PARTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def scrape_property(
     context: PlaywrightCrawlingContext,
-    llm_model: str,
-    llm_temperature: float,
     crawler_config: dict[str, Any],
-) -> ConsistencyCheckResult | None:
-    """Process a single property: scrape, analyze, and check consistency.
+) -> dict[str, Any]:
+    """Scrape property data from a page rendered in the browser.
     
     Args:
         context: Playwright crawling context
-        llm_model: LLM model to use
-        llm_temperature: LLM temperature
         crawler_config: Crawler configuration
+    
+    Returns:
+        Dictionary containing extracted property data
     """
     url = context.request.url
-    Actor.log.info(f'Processing property: {url}')
-    
     page = context.page
     
-    # Step 1: Scrape property data
+    await page.wait_for_load_state('domcontentloaded', timeout=15000)
+    
+    # Handle consent page if present (Bezrealitky typically doesn't have one)
+    await handle_consent_page(page, url, crawler_config)
+    
+    # Wait only until the listing title and parameter table are rendered instead of sleeping
+    # a fixed time (the extractor only needs the HTML, not network idle)
     try:
-        await page.wait_for_load_state('domcontentloaded', timeout=15000)
-        await page.wait_for_timeout(2000)
-        
-        # Handle consent page if present (Bezrealitky typically doesn't have one)
-        await handle_consent_page(page, url, crawler_config)
-        
-        # Wait for property content
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        
-        # Extract property data
-        property_data = await extract_property_data(page, url)
-        Actor.log.info(f'Scraped property: {property_data.get("title", "N/A")}')
-        
+        for selector in PROPERTY_CONTENT_SELECTORS:
+            await page.wait_for_selector(selector, timeout=PROPERTY_CONTENT_TIMEOUT_MS)
     except Exception as e:
-        Actor.log.exception(f'Error scraping property {url}: {e}')
-        # Fallback to mock data if scraping fails
-        Actor.log.warning(f'Scraping failed for {url}, outputting mock inconsistency results')
-        await push_mock_results_fallback(context)
-        return None
+        # Extract whatever is there; missing fields are handled downstream
+        Actor.log.debug('Property content not found on %s: %s', url, e)
+    
+    # Extract property data
+    return await extract_property_data(page, url)
+
+
+async def process_property(
+    property_data: dict[str, Any],
+    llm_model: str,
+    llm_temperature: float,
+) -> tuple[ConsistencyCheckResult | None, list[dict[str, Any]]]:
+    """Process a scraped property: analyze and check consistency.
+    
+    Args:
+        property_data: Scraped property data
+        llm_model: LLM model to use
+        llm_temperature: LLM temperature
+    
+    Returns:
+        Consistency result (for statistics tracking) and the dataset items to push
+    """
+    url = property_data.get('url', '')
+    Actor.log.info(f'Processing property: {url}')
+    
+    # Dataset items are collected here and pushed by the caller
+    pushes: list[dict[str, Any]] = []
     
     # Step 2: Convert scraped data to ListingInput using structured outputs
     listing_input = None
@@ -89,24 +179,20 @@ async def process_property(
         )
         
         if listing_input:
-            # Print the ListingInput
-            Actor.log.info('=' * 80)
-            Actor.log.info('LISTING INPUT (Structured Output):')
-            Actor.log.info('=' * 80)
-            Actor.log.info(json.dumps(listing_input.model_dump(mode='json'), indent=2, ensure_ascii=False))
-            Actor.log.info('=' * 80)
+            listing_input_data = listing_input.model_dump(mode='json')
+            log_structured_output('LISTING INPUT (Structured Output):', listing_input_data)
             
             # Store the ListingInput
-            await context.push_data({
+            pushes.append({
                 'type': 'listing_input',
-                'data': listing_input.model_dump(mode='json'),
+                'data': listing_input_data,
             })
             Actor.log.info(f'ListingInput stored: {listing_input.listing_id}')
         else:
             Actor.log.warning('Failed to convert scraped data to ListingInput')
             
     except Exception as e:
-        Actor.log.exception(f'Error converting to ListingInput: {e}')
+        log_error('Error converting to ListingInput: %s', e)
     
     # Step 3: Check consistency with structured outputs (if ListingInput was created)
     consistency_result = None
@@ -123,16 +209,11 @@ async def process_property(
             )
             
             if consistency_result:
-                # Print the ConsistencyCheckResult
-                Actor.log.info('=' * 80)
-                Actor.log.info('CONSISTENCY CHECK RESULT (Structured Output):')
-                Actor.log.info('=' * 80)
-                Actor.log.info(json.dumps(consistency_result.model_dump(mode='json'), indent=2, ensure_ascii=False))
-                Actor.log.info('=' * 80)
+                consistency_data = consistency_result.model_dump(mode='json')
+                log_structured_output('CONSISTENCY CHECK RESULT (Structured Output):', consistency_data)
                 
                 # Store the ConsistencyCheckResult
                 # Ensure all required fields are present before pushing
-                consistency_data = consistency_result.model_dump(mode='json')
                 
                 # Validate required fields are present
                 required_fields = ['listing_id', 'property_address', 'total_inconsistencies', 'is_consistent', 'summary']
@@ -140,14 +221,14 @@ async def process_property(
                 if missing_fields:
                     Actor.log.error(f'ConsistencyCheckResult missing required fields: {missing_fields}')
                 else:
-                    await context.push_data(consistency_data)
+                    pushes.append(consistency_data)
                     Actor.log.info(f'ConsistencyCheckResult stored: {consistency_result.total_inconsistencies} inconsistencies found')
                     Actor.log.debug(f'Pushed consistency result with {len(consistency_data.get("findings", []))} findings')
             else:
                 Actor.log.warning('Failed to check consistency with structured outputs')
                 
         except Exception as e:
-            Actor.log.exception(f'Error during structured consistency check: {e}')
+            log_error('Error during structured consistency check: %s', e)
     
     # Step 4: Fallback to old consistency check if structured output failed
     if not consistency_result:
@@ -169,12 +250,12 @@ async def process_property(
             if missing_fields:
                 Actor.log.error(f'Legacy ConsistencyCheckResult missing required fields: {missing_fields}')
             else:
-                await context.push_data(consistency_data)
+                pushes.append(consistency_data)
                 Actor.log.info(f'Legacy consistency check completed: {consistency_result.summary}')
                 Actor.log.debug(f'Pushed legacy consistency result with {len(consistency_data.get("findings", []))} findings')
             
         except Exception as e:
-            Actor.log.exception(f'Error during legacy consistency check: {e}')
+            log_error('Error during legacy consistency check: %s', e)
             # Fallback to mock data
             Actor.log.warning('Consistency check failed, outputting mock inconsistency results')
             mock_result = generate_mock_result_for_property(
@@ -194,7 +275,7 @@ async def process_property(
             if missing_fields:
                 Actor.log.error(f'Mock ConsistencyCheckResult missing required fields: {missing_fields}')
             else:
-                await context.push_data(mock_data)
+                pushes.append(mock_data)
                 Actor.log.debug(f'Pushed mock consistency result with {len(mock_data.get("findings", []))} findings')
             consistency_result = mock_result
     
@@ -206,12 +287,57 @@ async def process_property(
             'is_consistent': consistency_result.is_consistent,
         }
     
-    # Step 5: Push property data to dataset
-    await context.push_data(property_data)
+    # Step 5: Push property data together with the results collected above
+    pushes.append(property_data)
     Actor.log.info(f'Successfully processed property: {url}')
     
     # Return consistency result for statistics tracking
-    return consistency_result
+    return consistency_result, pushes
+
+
+async def process_property_batch(
+    batch: list[dict[str, Any]],
+    llm_model: str,
+    llm_temperature: float,
+) -> tuple[list[ConsistencyCheckResult | None], list[dict[str, Any]]]:
+    """Process several scraped properties concurrently and collect their dataset items.
+    
+    The LLM requests of all properties in the batch are in flight at the same time,
+    so a batch takes roughly as long as its slowest property.
+    
+    Args:
+        batch: Scraped property data
+        llm_model: LLM model to use
+        llm_temperature: LLM temperature
+    
+    Returns:
+        Tuple of the consistency result for each property (None where processing failed)
+        and the dataset items to push for the whole batch
+    """
+    outcomes = await asyncio.gather(
+        *(process_property(property_data, llm_model, llm_temperature) for property_data in batch),
+        return_exceptions=True,
+    )
+    
+    results: list[ConsistencyCheckResult | None] = []
+    pushes: list[dict[str, Any]] = []
+    for property_data, outcome in zip(batch, outcomes):
+        if isinstance(outcome, BaseException):
+            # A cancelled property task is a failed property (cancelling the batch itself raises
+            # from gather instead); interpreter exit isn't a processing failure, so let it propagate
+            if not isinstance(outcome, (Exception, asyncio.CancelledError)):
+                raise outcome
+            Actor.log.error(f'Error processing property {property_data.get("url")}: {outcome}')
+            # Fallback to mock data on any error
+            Actor.log.warning('Processing failed, outputting mock inconsistency results')
+            pushes.extend(mock_results_fallback_data())
+            results.append(None)
+        else:
+            consistency_result, items = outcome
+            pushes.extend(items)
+            results.append(consistency_result)
+    
+    return results, pushes
 
 
 async def main() -> None:
@@ -268,6 +394,8 @@ async def main() -> None:
                 # Invalid value, use default
                 llm_temperature = 0.01
                 Actor.log.warning(f'Invalid llmTemperature value: {llm_temperature_input}, using default: 0.01')
+        # Validated LLM responses are only shared between runs when explicitly enabled
+        set_persistent_llm_cache(bool(actor_input.get('cacheLlmResponses', False)))
         proxy_config = actor_input.get('proxyConfiguration', {'useApifyProxy': False})
         
         if not start_urls:
@@ -281,16 +409,35 @@ async def main() -> None:
         # Create crawler configuration
         crawler_config = {
             'max_requests_per_crawl': max_requests,
+            'max_request_retries': 3,
+            # Pages are mostly waiting on the network, so process several at once
+            'concurrency_settings': ConcurrencySettings(
+                desired_concurrency=min(8, max(1, max_requests)),
+                max_concurrency=16,
+            ),
+        }
+        # Browser crawler is only used for pages whose HTML lacks the listing content;
+        # its pages are tabs of one pooled browser, capped so rendering stays cheap
+        browser_crawler_config = {
+            **crawler_config,
+            'concurrency_settings': ConcurrencySettings(
+                desired_concurrency=min(MAX_PARALLEL_PAGES, max(1, max_requests)),
+                max_concurrency=MAX_PARALLEL_PAGES,
+            ),
             'headless': True,
             'browser_type': 'chromium',
-            'max_request_retries': 3,
+            'browser_launch_options': {'args': ['--disable-dev-shm-usage']},
+            # All tabs share one browser context, so connections and cookies carry over between pages
+            'use_incognito_pages': False,
         }
         
         if proxy_config.get('useApifyProxy'):
             Actor.log.info('Using Apify proxy')
         
-        # Create crawler
-        crawler = PlaywrightCrawler(**crawler_config)
+        # Create crawlers: plain HTTP first, Playwright as fallback
+        http_crawler = HttpCrawler(**crawler_config)
+        browser_crawler = PlaywrightCrawler(**browser_crawler_config)
+        browser_fallback_urls: list[str] = []
         
         # Track inconsistency analysis statistics
         inconsistency_stats = {
@@ -301,45 +448,141 @@ async def main() -> None:
             'inconsistency_checks_failed': 0,
         }
         
-        @crawler.router.default_handler
-        async def request_handler(context: PlaywrightCrawlingContext) -> None:
-            """Handle each Bezrealitky detail page request."""
+        def record_consistency_result(consistency_result: ConsistencyCheckResult | None) -> None:
+            """Update inconsistency statistics with the outcome of one property."""
+            inconsistency_stats['total_properties_processed'] += 1
+            if consistency_result:
+                inconsistency_stats['total_inconsistencies_found'] += consistency_result.total_inconsistencies
+                if consistency_result.is_consistent:
+                    inconsistency_stats['properties_consistent'] += 1
+                else:
+                    inconsistency_stats['properties_with_inconsistencies'] += 1
+            else:
+                inconsistency_stats['inconsistency_checks_failed'] += 1
+        
+        # Scraped properties are analyzed by a background worker so that crawler
+        # slots are freed while the LLM requests are in flight
+        llm_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        # Dataset items are buffered across batches and pushed in larger chunks
+        pending_pushes: list[dict[str, Any]] = []
+        
+        async def flush_pending_pushes() -> None:
+            """Push all buffered dataset items; items that fail to push stay buffered."""
+            if not pending_pushes:
+                return
+            items = pending_pushes[:]
             try:
-                # Process property and get inconsistency result
-                consistency_result = await process_property(
-                    context=context,
-                    llm_model=llm_model,
-                    llm_temperature=llm_temperature,
-                    crawler_config=crawler_config,
-                )
+                await Actor.push_data(items)
+            except Exception as e:
+                log_error('Could not push %d dataset item(s): %s', len(items), e)
+                return
+            del pending_pushes[:len(items)]
+        
+        async def llm_worker() -> None:
+            """Collect scraped properties into batches and process each batch concurrently."""
+            while True:
+                batch = [await llm_queue.get()]
+                while len(batch) < LLM_BATCH_SIZE:
+                    try:
+                        batch.append(await asyncio.wait_for(llm_queue.get(), timeout=LLM_BATCH_WAIT_SECONDS))
+                    except asyncio.TimeoutError:
+                        break
                 
-                # Update inconsistency statistics
-                inconsistency_stats['total_properties_processed'] += 1
-                if consistency_result:
-                    inconsistency_stats['total_inconsistencies_found'] += consistency_result.total_inconsistencies
-                    if consistency_result.is_consistent:
-                        inconsistency_stats['properties_consistent'] += 1
-                    else:
-                        inconsistency_stats['properties_with_inconsistencies'] += 1
-                else:
-                    inconsistency_stats['inconsistency_checks_failed'] += 1
+                try:
+                    try:
+                        results, pushes = await process_property_batch(batch, llm_model, llm_temperature)
+                    except Exception as e:
+                        log_error('Error processing property batch: %s', e)
+                        # Count and report the whole batch like properties that failed one by one
+                        Actor.log.warning('Batch processing failed, outputting mock inconsistency results')
+                        results = [None for _ in batch]
+                        pushes = [item for _ in batch for item in mock_results_fallback_data()]
                     
+                    for consistency_result in results:
+                        record_consistency_result(consistency_result)
+                    pending_pushes.extend(pushes)
+                    # The rest is pushed by the final flush once the queue is drained
+                    if len(pending_pushes) >= PUSH_BATCH_SIZE:
+                        await flush_pending_pushes()
+                finally:
+                    for _ in batch:
+                        llm_queue.task_done()
+        
+        @http_crawler.router.default_handler
+        async def http_request_handler(context: HttpCrawlingContext) -> None:
+            """Handle each Bezrealitky detail page request from its server-rendered HTML."""
+            url = context.request.url
+            try:
+                page_content = decode_html(
+                    await context.http_response.read(), context.http_response.headers.get('content-type')
+                )
+                property_data = await asyncio.to_thread(
+                    extract_property_data_from_html, page_content, url, context.request.loaded_url or url
+                )
             except Exception as e:
-                Actor.log.exception(f'Error processing property: {e}')
-                # Fallback to mock data on any error
-                Actor.log.warning('Processing failed, outputting mock inconsistency results')
+                Actor.log.warning(f'Could not extract {url} from HTML: {e}')
+                property_data = None
+            
+            if not property_data or not is_property_page_rendered(property_data):
+                Actor.log.info(f'Listing content missing in HTML, will render with browser: {url}')
+                browser_fallback_urls.append(url)
+                return
+            
+            Actor.log.info(f'Scraped property: {property_data.get("title", "N/A")}')
+            llm_queue.put_nowait(property_data)
+        
+        @http_crawler.failed_request_handler
+        async def http_failed_request_handler(context: BasicCrawlingContext, error: Exception) -> None:
+            """Render pages the HTTP crawler couldn't fetch (e.g. blocked or timed out) with the browser."""
+            url = context.request.url
+            Actor.log.warning('HTTP request failed after retries, will render with browser: %s (%s)', url, error)
+            browser_fallback_urls.append(url)
+        
+        @browser_crawler.pre_navigation_hook
+        async def block_requests_hook(context: PlaywrightPreNavCrawlingContext) -> None:
+            """Skip images, fonts, styles and trackers before the page is loaded."""
+            await context.page.route('**/*', block_unneeded_requests)
+        
+        @browser_crawler.router.default_handler
+        async def browser_request_handler(context: PlaywrightCrawlingContext) -> None:
+            """Handle each Bezrealitky detail page request in the browser."""
+            url = context.request.url
+            try:
+                property_data = await scrape_property(context, browser_crawler_config)
+            except Exception as e:
+                log_error('Error scraping property %s: %s', url, e)
+                # Fallback to mock data if scraping fails
+                Actor.log.warning(f'Scraping failed for {url}, outputting mock inconsistency results')
                 await push_mock_results_fallback(context)
-                inconsistency_stats['inconsistency_checks_failed'] += 1
+                record_consistency_result(None)
+                return
+            
+            Actor.log.info(f'Scraped property: {property_data.get("title", "N/A")}')
+            llm_queue.put_nowait(property_data)
         
         # Run the crawler
+        worker = asyncio.create_task(llm_worker())
         try:
-            await crawler.run(start_urls)
+            await http_crawler.run(start_urls)
+            if browser_fallback_urls:
+                Actor.log.info(f'Rendering {len(browser_fallback_urls)} page(s) with Playwright')
+                # Separate unique keys so the URLs already handled by the HTTP crawler aren't deduplicated
+                await browser_crawler.run([
+                    Request.from_url(url, unique_key=f'{url}#browser') for url in browser_fallback_urls
+                ])
+            # Wait for the LLM analysis of all scraped properties, then store what is buffered.
+            # The worker only stops if it fails, and then the queue would never drain.
+            queue_drained = asyncio.create_task(llm_queue.join())
+            await asyncio.wait({queue_drained, worker}, return_when=asyncio.FIRST_COMPLETED)
+            if worker.done():
+                queue_drained.cancel()
+                worker.result()
+                raise RuntimeError('LLM worker stopped before the queue was drained')
+            await flush_pending_pushes()
             Actor.log.info('Scraping completed successfully!')
             
             # Push final completion summary to ensure end results are stored
             try:
-                from datetime import datetime
-                
                 completion_summary = {
                     'type': 'completion_summary',
                     'status': 'success',
@@ -370,7 +613,6 @@ async def main() -> None:
                 Actor.log.warning(f'Could not push completion summary: {e}')
                 # Try to push a minimal completion status
                 try:
-                    from datetime import datetime
                     await Actor.push_data({
                         'type': 'completion_summary',
                         'status': 'success',
@@ -389,7 +631,6 @@ async def main() -> None:
             
             # Push failure summary to ensure error status is recorded
             try:
-                from datetime import datetime
                 await Actor.push_data({
                     'type': 'completion_summary',
                     'status': 'error',
@@ -402,3 +643,9 @@ async def main() -> None:
                 Actor.log.info('Error summary pushed to dataset')
             except Exception as e2:
                 Actor.log.debug(f'Could not push error summary: {e2}')
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+            # Items analyzed before a crawler failure are still stored
+            await flush_pending_pushes()
+            await close_openrouter_clients()
@@ -9,6 +9,7 @@ from src.models import (
     ListingInput,
     SeverityLevel,
 )
+from src.utils import generate_listing_id_from_url
 
 
 def generate_mock_inconsistency_results() -> list[ConsistencyCheckResult]:
@@ -163,8 +164,6 @@ def generate_mock_result_for_property(
     Returns:
         ConsistencyCheckResult object for the property
     """
-    from src.utils import generate_listing_id_from_url
-    
     listing_id = generate_listing_id_from_url(url)
     
     address = property_address or title or url
@@ -283,7 +282,6 @@ def generate_mock_listing_input(
         url = "https://www.bezrealitky.cz/nemovitosti-byty-domy/974793-nabidka-prodej-bytu-hostynska-praha"
     
     if not listing_id:
-        from src.utils import generate_listing_id_from_url
         listing_id = generate_listing_id_from_url(url)
     
     return ListingInput(
@@ -1,8 +1,9 @@
 from datetime import date, datetime
 from enum import Enum
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from apify import Actor
+from pydantic import BaseModel, Field, HttpUrl, ValidationInfo, model_validator
 
 
 class DistrictInfo(BaseModel):
@@ -186,6 +187,46 @@ class ConsistencyCheckResult(BaseModel):
         description="Brief one-line summary of the check (max 200 chars)"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _apply_defaults(cls, data: Any, info: ValidationInfo) -> Any:
+        """Fill in fields that LLM responses commonly omit or get wrong.
+        
+        Only applies when validating an LLM response with the listing as context
+        (``model_validate(data, context={...})``); ``listing_id`` and
+        ``property_address`` are taken from the context when missing. Results
+        constructed directly are validated as given.
+        """
+        if info.context is None or not isinstance(data, dict):
+            return data
+        data = dict(data)
+        
+        for key in ("listing_id", "property_address"):
+            if key not in data and info.context.get(key) is not None:
+                data[key] = info.context[key]
+        
+        findings = data.get("findings")
+        if not isinstance(findings, list):
+            if findings is not None:
+                Actor.log.warning("Findings is not a list, converting...")
+            findings = data["findings"] = []
+        findings_count = len(findings)
+        
+        reported_count = data.get("total_inconsistencies")
+        if reported_count is not None and reported_count != findings_count:
+            # If there's a mismatch, use the actual findings count (more reliable)
+            Actor.log.warning(
+                "total_inconsistencies (%s) doesn't match findings count (%d), using findings count",
+                reported_count, findings_count,
+            )
+        data["total_inconsistencies"] = findings_count
+        data.setdefault("is_consistent", findings_count == 0)
+        if not data.get("summary"):
+            data["summary"] = (
+                f"Found {findings_count} inconsistency(ies)" if findings_count > 0 else "No inconsistencies found"
+            )
+        return data
+
 
 # Bezrealitky.cz Scraper Models
 
@@ -1,10 +1,14 @@
 """Scraper service for Bezrealitky.cz property listings."""
 
+import asyncio
 import re
+import sys
+from itertools import islice
 from typing import Any
 
 from apify import Actor
 from crawlee.crawlers import PlaywrightCrawler, PlaywrightCrawlingContext
+from lxml import etree, html as lxml_html
 
 try:
     from .prague_districts import get_prague_admin_district
@@ -17,11 +21,91 @@ except ImportError:
         return None
 
 
+# Precompiled patterns used on every scraped page
+_RE_BEZ_REALITKY = re.compile(r'bez\s*realitky', re.IGNORECASE)
+_RE_LEADING_BULLETS = re.compile(r'^[•\-\s]+')
+_RE_PROPERTY_ID = re.compile(r'/(\d+)-')
+_RE_PRICE = re.compile(r'(\d+[\s\u200b]+\d+[\s\u200b]+\d+\s*Kč)')
+_RE_PRICE_M2 = re.compile(r'([\d\s\u200b]+Kč\s*/\s*m2)')
+_RE_FEATURES = re.compile(r'([^•\n]+•[^•\n]+)')
+_RE_AREA_TITLE = re.compile(r'(\d+\s*m²)')
+_RE_AREA_CONTENT = re.compile(r'Užitná plocha[:\s]+(\d+\s*m²)')
+_RE_DISPOSITION_TITLE = re.compile(r'\b(\d+\+(?:kk|1))\b', re.IGNORECASE)
+_RE_DISPOSITION_CONTENT = re.compile(r'Dispozice[:\s]+(\d+\+(?:kk|1))', re.IGNORECASE)
+_RE_DASH = re.compile(r'[-–]')
+_RE_TITLE_STREET = re.compile(r'(?:m²|realitky)\s*([^,]+)$', re.IGNORECASE)
+_RE_PHONE = re.compile(r'\+420\s*\d{3}\s*\d{3}\s*\d{3}')
+_RE_EMAIL = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_RE_CITY_ONLY = re.compile(r',\s*(Praha|Brno|Ostrava|Plzeň|Liberec|Olomouc)(?:\s|$)', re.IGNORECASE)
+
+# Charset declarations of fetched documents (Content-Type header, <meta> tag) and the
+# XML declaration lxml refuses in already decoded text
+_RE_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_RE_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_RE_XML_DECLARATION = re.compile(r'\s*<\?xml[^>]*\?>')
+# Browsers look for a <meta> charset declaration in the first 1024 bytes of a document
+META_CHARSET_SCAN_BYTES = 1024
+
+# Shared HTML parser; comments are never part of the extracted text and nothing looks
+# elements up by id, so the id hash table isn't built
+_HTML_PARSER = lxml_html.HTMLParser(remove_comments=True, collect_ids=False)
+# Elements whose text is code or markup rather than listing content
+_NON_CONTENT_TAGS = ('script', 'style', 'template')
+# Table rows holding exactly one key/value pair of cells
+_XPATH_DETAIL_ROWS = etree.XPath('//tr[count(.//td)=2]')
+# src attributes of all images, returned as strings without building element proxies
+_XPATH_IMAGE_SRCS = etree.XPath('//img/@src', smart_strings=False)
+
+# Cities recognized in listing titles ("..., <city> - <district>")
+CITIES = (
+    'Praha', 'Brno', 'Ostrava', 'Plzeň', 'Liberec', 'Olomouc', 'Ústí nad Labem',
+    'Hradec Králové', 'České Budějovice', 'Pardubice', 'Zlín', 'Havířov', 'Kladno',
+    'Most', 'Opava', 'Frýdek-Místek', 'Karviná', 'Jihlava', 'Teplice', 'Děčín',
+    'Karlovy Vary', 'Chomutov', 'Jablonec nad Nisou', 'Mladá Boleslav', 'Prostějov', 'Přerov',
+)
+_CITY_NAMES = frozenset(city.lower() for city in CITIES)
+
+# Output keys kept even when empty, so consumers can rely on their structure
+_ALWAYS_KEPT_KEYS = frozenset({'location', 'propertyDetails', 'seller'})
+_EMPTY_VALUES = (None, '', [], {})
+
+# Page text (lowercase) marking a listing sold directly by its owner
+OWNER_MARKERS = ('bez realitky', 'přímo majitel')
+
+# Number of breadcrumb items kept per listing
+MAX_BREADCRUMBS = 10
+
+# Paragraphs containing any of these are footer/legal/consent text, not a description
+DESCRIPTION_SKIP_KEYWORDS = (
+    'cookies', 'soukromí', 'podmínky', '© 20', 'seznam.cz',
+    'všechna práva', 'jakékoliv užití', 'odmítnout vše',
+    'přijmout vše', 'nastavit', 'consent', 'details',
+    'personalizovaná reklama', 'měření výkonu reklamy',
+)
+# Phrases that mark a paragraph as an English description
+ENGLISH_DESCRIPTION_PHRASES = (
+    'I am offering', 'The apartment', 'The property', 'The flat',
+    'For sale', 'For rent', 'Located in', 'This property',
+)
+
+AMENITY_KEYWORDS = (
+    'Sklep', 'Lodžie', 'Balkon', 'Terasa', 'Zahrada',
+    'Parkování', 'Garáž', 'Internet', 'Výtah', 'Bazén',
+)
+_AMENITY_BY_LOWER = {keyword.lower(): keyword for keyword in AMENITY_KEYWORDS}
+# All amenity keywords in one alternation, with an optional size (e.g. "Sklep 2 m²")
+_RE_AMENITIES = re.compile(
+    rf'({"|".join(map(re.escape, AMENITY_KEYWORDS))})(?:\s+(\d+\s*m²))?',
+    re.IGNORECASE,
+)
+
+
 def clean_text(text: str | None) -> str | None:
     """Clean and normalize text by removing extra whitespace."""
     if not text:
         return None
-    return re.sub(r'\s+', ' ', text.strip())
+    # str.split() strips and splits on the same characters as \s in one pass
+    return ' '.join(text.split()) or None
 
 
 def clean_street_name(street: str | None) -> str | None:
@@ -30,33 +114,70 @@ def clean_street_name(street: str | None) -> str | None:
         return None
     
     # Remove "bez realitky" text (with or without spaces)
-    street = re.sub(r'bez\s*realitky', '', street, flags=re.IGNORECASE)
+    street = _RE_BEZ_REALITKY.sub('', street)
     
     # Remove leading/trailing special characters and whitespace
     street = street.strip()
     
     # Remove leading bullet points, dashes, etc.
-    street = re.sub(r'^[•\-\s]+', '', street)
+    street = _RE_LEADING_BULLETS.sub('', street)
     
     # Clean up multiple spaces
-    street = re.sub(r'\s+', ' ', street)
+    street = ' '.join(street.split())
+    
+    return street or None
+
+
+def parse_title_location(title: str) -> tuple[str | None, str | None, str | None]:
+    """Parse street, city and district from a listing title in a single pass.
+    
+    Titles end with "<street>, <city> - <district>", so the title is split on its
+    last two commas and the city is looked up in a set instead of matched by a
+    regex alternation over all city names. Titles without a district fall back
+    to a city-only match.
+    
+    Args:
+        title: Listing title (e.g., "Prodej bytu 3+kk 57 m², bez realitky Hostýnská, Praha - Strašnice")
+    
+    Returns:
+        Tuple of (street, city, district); street is raw, city and district are
+        stripped, and each is None if not found
+    """
+    head, comma, segment = title.rpartition(',')
+    if comma:
+        segment = segment.lstrip()
+        # Try each dash as the separator, since city names can contain one (Frýdek-Místek)
+        for dash in _RE_DASH.finditer(segment):
+            city = segment[:dash.start()].rstrip()
+            if city.lower() in _CITY_NAMES:
+                district = segment[dash.end():]
+                if not district:
+                    break
+                street_match = _RE_TITLE_STREET.search(head.rpartition(',')[2])
+                street = street_match.group(1) if street_match else None
+                return street, city, district.strip() or None
     
-    return street.strip() if street.strip() else None
+    city_only_match = _RE_CITY_ONLY.search(title)
+    return None, (city_only_match.group(1) if city_only_match else None), None
 
 
-def extract_property_details(soup: Any) -> dict[str, Any]:
-    """Extract property details from Bezrealitky.cz listing page."""
+def extract_property_details(tree: Any) -> dict[str, Any]:
+    """Extract property details from Bezrealitky.cz listing page.
+    
+    Args:
+        tree: Parsed lxml HTML document of the listing page
+    """
     details = {}
     
     # Bezrealitky uses table format for property parameters
     # Look for key-value pairs in table rows
-    for row in soup.find_all('tr'):
-        cells = row.find_all('td')
-        if len(cells) == 2:
-            key = clean_text(cells[0].get_text())
-            value = clean_text(cells[1].get_text())
-            if key and value:
-                details[key] = value
+    for row in _XPATH_DETAIL_ROWS(tree):
+        key_cell, value_cell = row.iter('td')
+        key = clean_text(key_cell.text_content())
+        value = clean_text(value_cell.text_content())
+        if key and value:
+            # The same parameter names repeat on every listing; share one string per name
+            details[sys.intern(key)] = value
     
     return details
 
@@ -73,55 +194,110 @@ async def extract_property_data(page: Any, url: str) -> dict[str, Any]:
     """
     # Get page content once for parsing
     page_content = await page.content()
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(page_content, 'html.parser')
+    # Parsing is CPU-bound, keep it off the event loop so other pages keep loading
+    return await asyncio.to_thread(extract_property_data_from_html, page_content, url, page.url)
+
+
+def decode_html(body: bytes, content_type: str | None = None) -> str:
+    """Decode a fetched HTML document.
+    
+    The charset is taken from the Content-Type header, then from a <meta> declaration
+    at the start of the document, and defaults to UTF-8. Undecodable bytes are replaced.
+    
+    Args:
+        body: Raw response body
+        content_type: Content-Type header of the response
+    
+    Returns:
+        HTML text
+    """
+    charsets = []
+    header_match = _RE_CHARSET.search(content_type or '')
+    if header_match:
+        charsets.append(header_match.group(1))
+    meta_match = _RE_META_CHARSET.search(body, 0, META_CHARSET_SCAN_BYTES)
+    if meta_match:
+        charsets.append(meta_match.group(1).decode('ascii'))
+    
+    for charset in charsets:
+        try:
+            return body.decode(charset, errors='replace')
+        except LookupError:
+            Actor.log.debug('Unknown charset %s, trying the next candidate', charset)
+    return body.decode('utf-8', errors='replace')
+
+
+def extract_property_data_from_html(page_content: str, url: str, scraped_at: str) -> dict[str, Any]:
+    """Extract property data from the HTML of a Bezrealitky.cz page.
+    
+    Args:
+        page_content: HTML of the listing page
+        url: URL of the property listing
+        scraped_at: URL the HTML was actually loaded from
+    
+    Returns:
+        Dictionary containing extracted property data
+    """
+    # The text is already decoded, so an encoding declaration would only make lxml raise
+    xml_declaration = _RE_XML_DECLARATION.match(page_content)
+    html_text = page_content[xml_declaration.end():] if xml_declaration else page_content
+    tree = lxml_html.document_fromstring(html_text, parser=_HTML_PARSER)
+    # Script, style and template text (e.g. the __NEXT_DATA__ JSON) isn't page content;
+    # the tail text after these elements belongs to their parent and is kept
+    etree.strip_elements(tree, *_NON_CONTENT_TAGS, with_tail=False)
+    # Full document text, shared by all text-based extractors below
+    all_text = tree.text_content()
     
     # Extract main title (h1)
     title = None
     try:
-        title_elem = soup.find('h1')
-        if title_elem:
-            title = clean_text(title_elem.get_text())
-            Actor.log.info(f'Found title: {title}')
+        title_elem = tree.find('.//h1')
+        if title_elem is not None:
+            title = clean_text(title_elem.text_content())
+            Actor.log.info('Found title: %s', title)
     except Exception as e:
-        Actor.log.debug(f'Error extracting title: {e}')
+        Actor.log.debug('Error extracting title: %s', e)
     
     # Extract property ID from URL
     property_id = None
     try:
-        id_match = re.search(r'/(\d+)-', url)
+        id_match = _RE_PROPERTY_ID.search(url)
         if id_match:
             property_id = id_match.group(1)
-            Actor.log.info(f'Found property ID: {property_id}')
+            Actor.log.info('Found property ID: %s', property_id)
     except Exception as e:
-        Actor.log.debug(f'Error extracting property ID: {e}')
+        Actor.log.debug('Error extracting property ID: %s', e)
     
     # Extract price
     price = None
     price_per_m2 = None
     price_type = 'sale'
     try:
-        price_match = re.search(r'(\d+[\s​]+\d+[\s​]+\d+\s*Kč)', page_content)
+        price_match = _RE_PRICE.search(page_content)
         if price_match:
             price = clean_text(price_match.group(1))
-            Actor.log.info(f'Found price: {price}')
+            Actor.log.info('Found price: %s', price)
         
-        price_per_m2_match = re.search(r'([\d\s​]+Kč\s*/\s*m2)', page_content)
+        price_per_m2_match = _RE_PRICE_M2.search(page_content)
         if price_per_m2_match:
             price_per_m2 = clean_text(price_per_m2_match.group(1))
-            Actor.log.info(f'Found price per m²: {price_per_m2}')
+            Actor.log.info('Found price per m²: %s', price_per_m2)
     except Exception as e:
-        Actor.log.debug(f'Error extracting price: {e}')
+        Actor.log.debug('Error extracting price: %s', e)
     
     # Extract breadcrumbs and category
     breadcrumbs = []
     category = None
     try:
-        breadcrumb_items = soup.find_all('li', recursive=True)
-        for item in breadcrumb_items:
-            text = clean_text(item.get_text())
-            if text and len(text) < 50 and text not in breadcrumbs:
+        seen_breadcrumbs = set()
+        for item in tree.iter('li'):
+            text = clean_text(item.text_content())
+            if text and len(text) < 50 and text not in seen_breadcrumbs:
+                seen_breadcrumbs.add(text)
                 breadcrumbs.append(text)
+                # Only the first MAX_BREADCRUMBS are kept in the output
+                if len(breadcrumbs) == MAX_BREADCRUMBS:
+                    break
         
         if 'Prodej' in page_content:
             category = 'Prodej'
@@ -130,15 +306,15 @@ async def extract_property_data(page: Any, url: str) -> dict[str, Any]:
             price_type = 'rental'
         
         if breadcrumbs:
-            Actor.log.info(f'Found breadcrumbs: {breadcrumbs[:5]}')
+            Actor.log.info('Found breadcrumbs: %s', breadcrumbs[:5])
     except Exception as e:
-        Actor.log.debug(f'Error extracting breadcrumbs: {e}')
+        Actor.log.debug('Error extracting breadcrumbs: %s', e)
     
     # Extract description - get ALL paragraphs that form the complete description
     description = None
     description_english = None
     try:
-        paragraphs = soup.find_all('p')
+        paragraphs = tree.iter('p')
         
         # Collect all valid description paragraphs
         czech_paragraphs = []
@@ -146,28 +322,25 @@ async def extract_property_data(page: Any, url: str) -> dict[str, Any]:
         
         for p in paragraphs:
             try:
-                text = clean_text(p.get_text())
+                raw_text = p.text_content()
+                # Cleaning never lengthens text, so short paragraphs can be skipped up front
+                if len(raw_text) < 50:
+                    continue
+                
+                text = clean_text(raw_text)
                 
                 # Skip if too short or contains footer/legal content
                 if not text or len(text) < 50:
                     continue
                     
                 # Filter out non-description content
-                skip_keywords = [
-                    'cookies', 'soukromí', 'podmínky', '© 20', 'seznam.cz',
-                    'všechna práva', 'jakékoliv užití', 'odmítnout vše',
-                    'přijmout vše', 'nastavit', 'consent', 'details',
-                    'personalizovaná reklama', 'měření výkonu reklamy'
-                ]
-                
-                if any(skip in text.lower() for skip in skip_keywords):
+                text_lower = text.lower()
+                if any(skip in text_lower for skip in DESCRIPTION_SKIP_KEYWORDS):
                     continue
                 
                 # Detect if it's English (starts with common English phrases)
-                is_english = any(eng in text[:80] for eng in [
-                    'I am offering', 'The apartment', 'The property', 'The flat',
-                    'For sale', 'For rent', 'Located in', 'This property'
-                ])
+                text_start = text[:80]
+                is_english = any(eng in text_start for eng in ENGLISH_DESCRIPTION_PHRASES)
                 
                 if is_english:
                     english_paragraphs.append(text)
@@ -176,45 +349,48 @@ async def extract_property_data(page: Any, url: str) -> dict[str, Any]:
                     czech_paragraphs.append(text)
                     
             except Exception as e:
-                Actor.log.debug(f'Error processing paragraph: {e}')
+                Actor.log.debug('Error processing paragraph: %s', e)
                 continue
         
         # Combine Czech paragraphs into full description
         if czech_paragraphs:
             # Join all paragraphs with double newline for readability
             description = '\n\n'.join(czech_paragraphs)
-            Actor.log.info(f'Found description: {len(description)} characters ({len(czech_paragraphs)} paragraphs)')
+            Actor.log.info('Found description: %d characters (%d paragraphs)', len(description), len(czech_paragraphs))
         
         # Combine English paragraphs if available
         if english_paragraphs:
             description_english = '\n\n'.join(english_paragraphs)
-            Actor.log.info(f'Found English description: {len(description_english)} characters ({len(english_paragraphs)} paragraphs)')
+            Actor.log.info('Found English description: %d characters (%d paragraphs)', len(description_english), len(english_paragraphs))
             
     except Exception as e:
-        Actor.log.debug(f'Error extracting description: {e}')
+        Actor.log.debug('Error extracting description: %s', e)
     
     # Extract subtitle features
     subtitle_features = []
     try:
-        all_text = soup.get_text()
-        features_match = re.findall(r'([^•\n]+•[^•\n]+)', all_text)
-        if features_match:
-            for feature_line in features_match[:3]:
-                features = [clean_text(f) for f in feature_line.split('•')]
+        first_bullet = all_text.find('•')
+        if first_bullet != -1:
+            # No feature line can start before the line holding the first bullet,
+            # so skip the regex scan over the rest of the page
+            line_start = all_text.rfind('\n', 0, first_bullet) + 1
+            features_match = _RE_FEATURES.finditer(all_text, line_start)
+            for feature_match in islice(features_match, 3):
+                features = [clean_text(f) for f in feature_match.group(1).split('•')]
                 subtitle_features.extend([f for f in features if f and len(f) < 50])
         
         if subtitle_features:
-            Actor.log.info(f'Found subtitle features: {subtitle_features[:5]}')
+            Actor.log.info('Found subtitle features: %s', subtitle_features[:5])
     except Exception as e:
-        Actor.log.debug(f'Error extracting subtitle features: {e}')
+        Actor.log.debug('Error extracting subtitle features: %s', e)
     
     # Extract attributes
     attributes = {}
     try:
-        attributes = extract_property_details(soup)
-        Actor.log.info(f'Found {len(attributes)} property attributes')
+        attributes = extract_property_details(tree)
+        Actor.log.info('Found %d property attributes', len(attributes))
     except Exception as e:
-        Actor.log.debug(f'Error extracting attributes: {e}')
+        Actor.log.debug('Error extracting attributes: %s', e)
     
     # Extract critical structured data
     property_details = {}
@@ -226,75 +402,73 @@ async def extract_property_data(page: Any, url: str) -> dict[str, Any]:
         area = attributes.get('Užitná plocha')
         
         if not area and title:
-            area_match = re.search(r'(\d+\s*m²)', title)
+            area_match = _RE_AREA_TITLE.search(title)
             if area_match:
                 area = clean_text(area_match.group(1))
-                Actor.log.info(f'✓ Extracted area from title: {area}')
+                Actor.log.info('✓ Extracted area from title: %s', area)
         
         if not area:
-            all_text = soup.get_text()
-            area_match = re.search(r'Užitná plocha[:\s]+(\d+\s*m²)', all_text)
+            area_match = _RE_AREA_CONTENT.search(all_text)
             if area_match:
                 area = clean_text(area_match.group(1))
-                Actor.log.info(f'✓ Extracted area from content: {area}')
+                Actor.log.info('✓ Extracted area from content: %s', area)
         
         # Extract disposition
         disposition = attributes.get('Dispozice')
         
         if not disposition and title:
-            disposition_match = re.search(r'\b(\d+\+(?:kk|1))\b', title, re.IGNORECASE)
+            disposition_match = _RE_DISPOSITION_TITLE.search(title)
             if disposition_match:
                 disposition = disposition_match.group(1)
-                Actor.log.info(f'✓ Extracted disposition from title: {disposition}')
+                Actor.log.info('✓ Extracted disposition from title: %s', disposition)
         
         if not disposition:
-            all_text = soup.get_text()
-            disposition_match = re.search(r'Dispozice[:\s]+(\d+\+(?:kk|1))', all_text, re.IGNORECASE)
+            disposition_match = _RE_DISPOSITION_CONTENT.search(all_text)
             if disposition_match:
                 disposition = disposition_match.group(1)
-                Actor.log.info(f'✓ Extracted disposition from content: {disposition}')
-        
-        # Build property details
-        property_details['propertyId'] = property_id or attributes.get('Číslo inzerátu')
-        property_details['area'] = area
-        property_details['disposition'] = disposition
-        property_details['floor'] = attributes.get('Podlaží')
-        property_details['buildingType'] = attributes.get('Konstrukce budovy')
-        property_details['condition'] = attributes.get('Stav')
-        property_details['ownership'] = attributes.get('Vlastnictví')
-        property_details['furnished'] = attributes.get('Vybaveno')
-        property_details['energyRating'] = attributes.get('PENB')
-        property_details['availableFrom'] = attributes.get('Dostupné od')
-        property_details['pricePerM2'] = price_per_m2 or attributes.get('Cena za jednotku')
+                Actor.log.info('✓ Extracted disposition from content: %s', disposition)
         
-        property_details = {k: v for k, v in property_details.items() if v}
+        # Build property details, keeping only the fields that were found
+        property_details = {key: value for key, value in (
+            ('propertyId', property_id or attributes.get('Číslo inzerátu')),
+            ('area', area),
+            ('disposition', disposition),
+            ('floor', attributes.get('Podlaží')),
+            ('buildingType', attributes.get('Konstrukce budovy')),
+            ('condition', attributes.get('Stav')),
+            ('ownership', attributes.get('Vlastnictví')),
+            ('furnished', attributes.get('Vybaveno')),
+            ('energyRating', attributes.get('PENB')),
+            ('availableFrom', attributes.get('Dostupné od')),
+            ('pricePerM2', price_per_m2 or attributes.get('Cena za jednotku')),
+        ) if value}
         
         if property_details:
-            Actor.log.info(f'✓ Extracted {len(property_details)} structured property details')
+            Actor.log.info('✓ Extracted %d structured property details', len(property_details))
     except Exception as e:
-        Actor.log.error(f'Error structuring property details: {e}')
+        Actor.log.error('Error structuring property details: %s', e)
     
     # Extract amenities
     amenities = []
     try:
-        all_text = soup.get_text()
-        amenity_keywords = [
-            'Sklep', 'Lodžie', 'Balkon', 'Terasa', 'Zahrada', 
-            'Parkování', 'Garáž', 'Internet', 'Výtah', 'Bazén'
-        ]
+        # Single pass over the text, keeping the first occurrence of each keyword
+        amenity_matches = {}
+        for amenity_match in _RE_AMENITIES.finditer(all_text):
+            keyword = _AMENITY_BY_LOWER[amenity_match.group(1).lower()]
+            if keyword not in amenity_matches:
+                amenity_matches[keyword] = amenity_match.group(2)
+                if len(amenity_matches) == len(AMENITY_KEYWORDS):
+                    break
         
-        for keyword in amenity_keywords:
-            amenity_match = re.search(rf'{keyword}(?:\s+(\d+\s*m²))?', all_text, re.IGNORECASE)
-            if amenity_match:
-                if amenity_match.group(1):
-                    amenities.append(f"{keyword} {amenity_match.group(1)}")
-                else:
-                    amenities.append(keyword)
+        for keyword in AMENITY_KEYWORDS:
+            if keyword in amenity_matches:
+                size = amenity_matches[keyword]
+                amenities.append(f"{keyword} {size}" if size else keyword)
         
         if amenities:
-            Actor.log.info(f'Found amenities: {amenities}')
+            Actor.log.info('Found amenities: %s', amenities)
     except Exception as e:
-        Actor.log.debug(f'Error extracting amenities: {e}')
+        Actor.log.debug('Error extracting amenities: %s', e)
     
     # Extract location details
     location = None
@@ -304,31 +478,18 @@ async def extract_property_data(page: Any, url: str) -> dict[str, Any]:
     
     try:
         if title:
-            # Extract city and district from title
-            city_district_match = re.search(
-                r',\s*(Praha|Brno|Ostrava|Plzeň|Liberec|Olomouc|Ústí nad Labem|Hradec Králové|České Budějovice|Pardubice|Zlín|Havířov|Kladno|Most|Opava|Frýdek-Místek|Karviná|Jihlava|Teplice|Děčín|Karlovy Vary|Chomutov|Jablonec nad Nisou|Mladá Boleslav|Prostějov|Přerov)\s*[-–]\s*([^,]+?)$',
-                title,
-                re.IGNORECASE
-            )
+            # Extract street, city and district from title
+            street, city, district = parse_title_location(title)
+            city = clean_text(city)
+            street = clean_street_name(street)
             
-            if city_district_match:
-                city = clean_text(city_district_match.group(1))
-                district = clean_text(city_district_match.group(2))
-                Actor.log.info(f'✓ Found city: {city}, district: {district}')
-                
-                # Extract street
-                street_pattern = rf'(?:m²|realitky)\s*([^,]+?),\s*{re.escape(city)}'
-                street_match = re.search(street_pattern, title, re.IGNORECASE)
-                if street_match:
-                    street = clean_street_name(street_match.group(1))
-                    if street:  # Only log if we have a valid street after cleaning
-                        Actor.log.info(f'✓ Found street: {street}')
-            else:
-                # Fallback: city only
-                city_only_match = re.search(r',\s*(Praha|Brno|Ostrava|Plzeň|Liberec|Olomouc)(?:\s|$)', title, re.IGNORECASE)
-                if city_only_match:
-                    city = clean_text(city_only_match.group(1))
-                    Actor.log.info(f'✓ Found city: {city}')
+            if district:
+                district = clean_text(district)
+                Actor.log.info('✓ Found city: %s, district: %s', city, district)
+                if street:  # Only log if we have a valid street after cleaning
+                    Actor.log.info('✓ Found street: %s', street)
+            elif city:
+                Actor.log.info('✓ Found city: %s', city)
         
         # Build location
         if city and district:
@@ -343,7 +504,7 @@ async def extract_property_data(page: Any, url: str) -> dict[str, Any]:
         if city and city.lower() == 'praha' and district:
             prague_admin_district = get_prague_admin_district(district)
             if prague_admin_district:
-                Actor.log.info(f'✓ Mapped to {prague_admin_district}')
+                Actor.log.info('✓ Mapped to %s', prague_admin_district)
                 
                 # Get real estate and crime statistics for the district
                 try:
@@ -361,49 +522,57 @@ async def extract_property_data(page: Any, url: str) -> dict[str, Any]:
                             },
                             'kebabIndex': district_info.kebab_index_normalized,
                         }
-                        Actor.log.info(f'✓ Added district statistics: Avg price {district_stats["avgPricePerSqmCzk"]} Kč/m², Crime: {district_stats["crimeStats"]["violentCrimes"]} violent')
+                        Actor.log.info('✓ Added district statistics: Avg price %s Kč/m², Crime: %s violent', district_stats["avgPricePerSqmCzk"], district_stats["crimeStats"]["violentCrimes"])
                 except (ValueError, AttributeError, KeyError) as e:
-                    Actor.log.debug(f'Could not get district statistics: {e}')
+                    Actor.log.debug('Could not get district statistics: %s', e)
     except Exception as e:
-        Actor.log.error(f'Error extracting location: {e}')
+        Actor.log.error('Error extracting location: %s', e)
     
     # Extract images
     images = []
     try:
-        img_elements = soup.find_all('img', src=True)
-        for img in img_elements:
-            src = img.get('src', '')
-            if any(pattern in src for pattern in ['img.bezrealitky', 'images', 'foto', 'photo']):
+        seen_images = set()
+        for src in _XPATH_IMAGE_SRCS(tree):
+            # Keep only listing photos (not icons or logos); plain substring checks are
+            # cheaper than a regex for these short URLs
+            if 'img.bezrealitky' in src or 'images' in src or 'foto' in src or 'photo' in src:
                 if src.startswith('//'):
                     src = 'https:' + src
                 elif src.startswith('/'):
                     src = 'https://www.bezrealitky.cz' + src
-                if src not in images and src.startswith('http'):
+                if src not in seen_images and src.startswith('http'):
+                    seen_images.add(src)
                     images.append(src)
         
         if images:
-            Actor.log.info(f'Found {len(images)} images')
+            Actor.log.info('Found %d images', len(images))
     except Exception as e:
-        Actor.log.debug(f'Error extracting images: {e}')
+        Actor.log.debug('Error extracting images: %s', e)
     
     # Extract seller information
     seller_info = {}
     try:
-        if 'bez realitky' in page_content.lower() or 'přímo majitel' in page_content.lower():
+        # Markers usually appear verbatim, so the page is only lowercased when they don't
+        is_owner = any(marker in page_content for marker in OWNER_MARKERS)
+        if not is_owner:
+            page_content_lower = page_content.lower()
+            is_owner = any(marker in page_content_lower for marker in OWNER_MARKERS)
+        
+        if is_owner:
             seller_info['type'] = 'owner'
             seller_info['note'] = 'Prodává přímo majitel - bez provize'
         else:
             seller_info['type'] = 'agent'
         
-        phone_match = re.search(r'\+420\s*\d{3}\s*\d{3}\s*\d{3}', page_content)
+        phone_match = _RE_PHONE.search(page_content)
         if phone_match:
             seller_info['phone'] = clean_text(phone_match.group())
         
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', page_content)
+        email_match = _RE_EMAIL.search(page_content)
         if email_match:
             seller_info['email'] = email_match.group()
     except Exception as e:
-        Actor.log.debug(f'Error extracting seller info: {e}')
+        Actor.log.debug('Error extracting seller info: %s', e)
     
     # Build final data structure
     data = {
@@ -429,19 +598,15 @@ async def extract_property_data(page: Any, url: str) -> dict[str, Any]:
         'amenities': amenities,
         'images': images,
         'seller': seller_info,
-        'breadcrumbs': breadcrumbs[:10] if breadcrumbs else [],
-        'scrapedAt': page.url,
+        'breadcrumbs': breadcrumbs,
+        'scrapedAt': scraped_at,
     }
     
-    # Clean up empty values but keep structure
-    data_cleaned = {}
-    for key, value in data.items():
-        if key in ['location', 'propertyDetails', 'seller']:
-            data_cleaned[key] = value
-        elif value not in [None, '', [], {}]:
-            data_cleaned[key] = value
+    # Clean up empty values in place but keep structure
+    for key in [key for key, value in data.items() if key not in _ALWAYS_KEPT_KEYS and value in _EMPTY_VALUES]:
+        del data[key]
     
-    return data_cleaned
+    return data
 
 
 async def handle_consent_page(page: Any, url: str, crawler_config: dict[str, Any]) -> bool:
@@ -2,12 +2,29 @@
 
 import hashlib
 import json
+import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Any, List
+
+from apify import Actor
 
 from .models import ScrapeOutput
 
 
+def log_error(message: str, *args: Any) -> None:
+    """Log an error, with the traceback of the exception being handled only at DEBUG level.
+    
+    Formatting a traceback is expensive, so production runs only log the message.
+    
+    Args:
+        message: Log message with %-style placeholders
+        *args: Values for the placeholders
+    """
+    Actor.log.error(message, *args, exc_info=Actor.log.isEnabledFor(logging.DEBUG))
+
+
+@lru_cache(maxsize=4096)
 def generate_listing_id_from_url(url: str) -> str:
     """Generate a standardized listing ID from a URL.
     
@@ -17,7 +34,8 @@ def generate_listing_id_from_url(url: str) -> str:
     Returns:
         Listing ID in format "PRG-XXXXXXXXXXXX" (12 uppercase hex characters)
     """
-    listing_id = hashlib.md5(url.encode()).hexdigest()[:12].upper()
+    # The digest is only an identifier, not a security measure
+    listing_id = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:12].upper()
     return f"PRG-{listing_id}"
 
 
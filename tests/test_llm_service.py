@@ -6,11 +6,21 @@ from unittest.mock import AsyncMock, patch, MagicMock
 from typing import Any
 
 from src.llm_service import (
+    cache_llm_response,
+    call_openrouter_llm,
+    close_openrouter_clients,
+    collect_streamed_message,
     convert_scraped_data_to_listing_input,
     check_consistency_with_structured_output,
     extract_number_from_text,
     extract_float_from_text,
+    get_apify_token,
+    get_openrouter_client,
+    parse_json_content,
+    request_streamed_message,
     sanitize_json_schema_for_llm,
+    set_persistent_llm_cache,
+    strip_non_numeric,
 )
 from src.models import ListingInput, ConsistencyCheckResult
 from src.mock_data import (
@@ -19,6 +29,44 @@ from src.mock_data import (
 )
 
 
+def make_chunk(
+    content: str | None = None,
+    refusal: str | None = None,
+    tool_calls: list[Any] | None = None,
+) -> MagicMock:
+    """Build a streamed chat completion chunk with a single choice delta."""
+    delta = MagicMock(role="assistant", content=content, refusal=refusal, tool_calls=tool_calls)
+    return MagicMock(choices=[MagicMock(delta=delta)])
+
+
+def make_tool_call_delta(index: int, name: str | None = None, arguments: str | None = None) -> MagicMock:
+    """Build a streamed tool call fragment."""
+    function = MagicMock(arguments=arguments)
+    function.name = name
+    return MagicMock(index=index, function=function)
+
+
+class FakeStream:
+    """Chat completion stream stub: async iterable of chunks and async context manager."""
+    
+    def __init__(self, chunks: list[Any], error: Exception | None = None):
+        self.chunks = chunks
+        self.error = error
+        self.closed = False
+    
+    async def __aenter__(self) -> "FakeStream":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.closed = True
+    
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error:
+            raise self.error
+
+
 class TestSanitizeJsonSchema:
     """Test JSON schema sanitization for LLM compatibility."""
     
@@ -174,6 +222,178 @@ class TestExtractHelpers:
         assert extract_float_from_text("Price: 8.5 million") == 8.5
         assert extract_float_from_text("No numbers") is None
         assert extract_float_from_text(None) is None
+    
+    def test_strip_non_numeric(self):
+        """Test stripping currency, units and spaces from prices."""
+        assert strip_non_numeric("8 499 000 Kč") == "8499000"
+        assert strip_non_numeric("149\u200b000 Kč") == "149000"
+        assert strip_non_numeric("57.5 m²") == "57.5"
+
+
+class TestParseJsonContent:
+    """Test JSON parsing of LLM response content."""
+    
+    def test_parse_plain_json(self):
+        """Test parsing a bare JSON object."""
+        assert parse_json_content('{"a": 1}') == {"a": 1}
+    
+    def test_parse_json_wrapped_in_markdown(self):
+        """Test parsing JSON surrounded by prose and a markdown fence."""
+        content = 'Here is the result:\n```json\n{"a": [1, 2]}\n```\nDone.'
+        assert parse_json_content(content) == {"a": [1, 2]}
+    
+    def test_parse_top_level_array(self):
+        """Test that a bare JSON array is returned as-is rather than its first object."""
+        assert parse_json_content('[{"a": 1}, {"b": 2}]') == [{"a": 1}, {"b": 2}]
+    
+    def test_parse_without_json(self):
+        """Test that content without a JSON object returns None."""
+        assert parse_json_content("This is not valid JSON") is None
+    
+    def test_parse_passes_through_dict(self):
+        """Test that already parsed content is returned unchanged."""
+        data = {"a": 1}
+        assert parse_json_content(data) is data
+
+
+class TestOpenRouterClient:
+    """Test reuse of the shared OpenRouter client."""
+    
+    @pytest.mark.asyncio
+    async def test_client_reused_per_token(self):
+        """Test that the same token returns the same client and a new token a new one."""
+        try:
+            client = get_openrouter_client("token-a")
+            assert get_openrouter_client("token-a") is client
+            assert get_openrouter_client("token-b") is not client
+        finally:
+            await close_openrouter_clients()
+    
+    def test_apify_token_resolved_once(self, monkeypatch):
+        """Test that the token is cached after the first lookup."""
+        monkeypatch.setattr("src.llm_service._apify_token", None)
+        monkeypatch.setattr("src.llm_service.Actor.get_env", MagicMock(return_value={}))
+        monkeypatch.setenv("APIFY_TOKEN", "token-a")
+        assert get_apify_token() == "token-a"
+        
+        monkeypatch.setenv("APIFY_TOKEN", "token-b")
+        assert get_apify_token() == "token-a"
+
+
+class TestStreamedMessage:
+    """Test assembling streamed LLM responses."""
+    
+    @pytest.mark.asyncio
+    async def test_tool_call_arguments_joined_per_index(self):
+        """Test that tool call fragments are joined by index and ordered."""
+        stream = FakeStream([
+            make_chunk(tool_calls=[make_tool_call_delta(1, "second", '{"b"')]),
+            make_chunk(tool_calls=[make_tool_call_delta(0, "first", '{"a": ')]),
+            make_chunk(tool_calls=[make_tool_call_delta(0, arguments='1}'), make_tool_call_delta(1, arguments=': 2}')]),
+        ])
+        message = await collect_streamed_message(stream)
+        
+        assert message["content"] is None
+        assert message["tool_calls"] == [
+            {"function": {"name": "first", "arguments": '{"a": 1}'}},
+            {"function": {"name": "second", "arguments": '{"b": 2}'}},
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_refusal_collected(self):
+        """Test that refusal fragments are joined and no tool calls are reported."""
+        stream = FakeStream([make_chunk(refusal="I can't "), make_chunk(refusal="help with that.")])
+        message = await collect_streamed_message(stream)
+        
+        assert message == {"role": "assistant", "content": None, "refusal": "I can't help with that."}
+    
+    @pytest.mark.asyncio
+    async def test_broken_stream_requested_again(self, monkeypatch):
+        """Test that a stream failing mid-response is re-requested and every stream is closed."""
+        monkeypatch.setattr("src.llm_service.asyncio.sleep", AsyncMock())
+        streams = [
+            FakeStream([make_chunk('{"ok"')], error=ConnectionError("connection reset")),
+            FakeStream([make_chunk('{"ok"'), make_chunk(': true}')]),
+        ]
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(side_effect=streams)
+        message = await request_streamed_message(client, {"model": "test-model", "messages": []})
+        
+        assert message["content"] == '{"ok": true}'
+        assert client.chat.completions.create.await_count == 2
+        assert all(stream.closed for stream in streams)
+
+
+class TestLlmResponseCache:
+    """Test caching of identical LLM requests."""
+    
+    @pytest.fixture
+    def llm_client(self, monkeypatch):
+        """Stub the OpenRouter client and the response caches."""
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(
+            side_effect=lambda **kwargs: FakeStream([make_chunk('{"ok"'), make_chunk(': true}')])
+        )
+        client.store = MagicMock(get_value=AsyncMock(return_value=None), set_value=AsyncMock())
+        monkeypatch.setattr("src.llm_service._llm_response_cache", {})
+        monkeypatch.setattr("src.llm_service._persist_llm_responses", False)
+        monkeypatch.setattr("src.llm_service.get_apify_token", lambda: "token")
+        monkeypatch.setattr("src.llm_service.get_openrouter_client", lambda token: client)
+        monkeypatch.setattr(
+            "src.llm_service.Actor.open_key_value_store", AsyncMock(return_value=client.store), raising=False
+        )
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_validated_response_served_from_cache(self, llm_client):
+        """Test that repeating a request doesn't call the API again once its response was validated."""
+        set_persistent_llm_cache(True)
+        messages = [{"role": "user", "content": "Analyze this listing"}]
+        first = await call_openrouter_llm(messages, model="test-model")
+        await cache_llm_response(first, first["choices"][0]["message"]["content"])
+        second = await call_openrouter_llm(messages, model="test-model")
+        
+        assert llm_client.chat.completions.create.await_count == 1
+        assert first["choices"][0]["message"]["content"] == '{"ok": true}'
+        assert second["choices"][0]["message"]["content"] == '{"ok": true}'
+        llm_client.store.set_value.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_unvalidated_response_not_cached(self, llm_client):
+        """Test that a response the caller didn't accept is requested again."""
+        messages = [{"role": "user", "content": "Analyze this listing"}]
+        await call_openrouter_llm(messages, model="test-model")
+        await call_openrouter_llm(messages, model="test-model")
+        
+        assert llm_client.chat.completions.create.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_persistent_store_and_sampled_requests_skipped(self, llm_client):
+        """Test that the store is off by default and higher temperatures aren't cached."""
+        messages = [{"role": "user", "content": "Analyze this listing"}]
+        deterministic = await call_openrouter_llm(messages, model="test-model")
+        await cache_llm_response(deterministic, '{"ok": true}')
+        sampled = await call_openrouter_llm(messages, model="test-model", temperature=0.7)
+        await cache_llm_response(sampled, '{"ok": true}')
+        await call_openrouter_llm(messages, model="test-model", temperature=0.7)
+        
+        assert "cache_key" not in sampled
+        assert llm_client.chat.completions.create.await_count == 3
+        llm_client.store.get_value.assert_not_awaited()
+        llm_client.store.set_value.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_memory_cache_bounded(self, llm_client, monkeypatch):
+        """Test that the oldest responses are dropped once the in-memory cache is full."""
+        monkeypatch.setattr("src.llm_service.LLM_CACHE_MAX_ENTRIES", 2)
+        for listing in ("a", "b", "c"):
+            messages = [{"role": "user", "content": f"Analyze listing {listing}"}]
+            result = await call_openrouter_llm(messages, model="test-model")
+            await cache_llm_response(result, '{"ok": true}')
+        await call_openrouter_llm([{"role": "user", "content": "Analyze listing c"}], model="test-model")
+        await call_openrouter_llm([{"role": "user", "content": "Analyze listing a"}], model="test-model")
+        
+        assert llm_client.chat.completions.create.await_count == 4
 
 
 class TestConvertScrapedDataToListingInput:
@@ -476,6 +696,52 @@ class TestCheckConsistencyWithStructuredOutput:
             assert result.is_consistent is True
             assert result.total_inconsistencies == 0
     
+    @pytest.mark.asyncio
+    async def test_check_consistency_fills_missing_fields(self, mock_listing_input):
+        """Test that fields omitted by the LLM are defaulted from the listing."""
+        mock_llm_response = {
+            "choices": [
+                {
+                    "message": {
+                        "role": "assistant",
+                        "content": json.dumps({"total_inconsistencies": 3, "findings": []}),
+                    }
+                }
+            ]
+        }
+        
+        with patch("src.llm_service.call_openrouter_llm", new_callable=AsyncMock) as mock_llm, \
+                patch("src.models.Actor.log.warning") as mock_warning:
+            mock_llm.return_value = mock_llm_response
+            
+            result = await check_consistency_with_structured_output(
+                listing_input=mock_listing_input,
+                model="test-model",
+                temperature=0.7,
+            )
+            
+            assert result is not None
+            assert result.listing_id == mock_listing_input.listing_id
+            assert result.property_address == mock_listing_input.property_address
+            assert result.total_inconsistencies == 0
+            assert result.is_consistent is True
+            assert result.summary == "No inconsistencies found"
+            # The reported count of 3 was replaced, and the mismatch was logged
+            mock_warning.assert_called_once()
+    
+    def test_result_without_context_validated_as_given(self):
+        """Test that results constructed directly (e.g. mock results) keep their fields."""
+        result = ConsistencyCheckResult(
+            listing_id="PRG-000000000001",
+            property_address="Vinohradská, Praha",
+            total_inconsistencies=2,
+            is_consistent=False,
+            findings=[],
+            summary="Two issues",
+        )
+        
+        assert result.total_inconsistencies == 2
+    
     @pytest.mark.asyncio
     async def test_check_consistency_llm_failure(self, mock_listing_input):
         """Test consistency check when LLM returns None."""
@@ -0,0 +1,106 @@
+"""Tests for scraper helper functions."""
+
+from src.scraper_service import (
+    clean_text,
+    decode_html,
+    extract_property_data_from_html,
+    parse_title_location,
+)
+
+
+class TestCleanText:
+    """Test whitespace normalization."""
+
+    def test_collapses_whitespace(self):
+        """Test that runs of whitespace become single spaces."""
+        assert clean_text("  Praha \n\t 10 ") == "Praha 10"
+
+    def test_blank_text(self):
+        """Test that empty and whitespace-only text gives None."""
+        assert clean_text(None) is None
+        assert clean_text(" \n ") is None
+
+
+class TestParseTitleLocation:
+    """Test street, city and district parsing from listing titles."""
+
+    def test_street_city_and_district(self):
+        """Test parsing a full title."""
+        street, city, district = parse_title_location(
+            "Prodej bytu 3+kk 57 m², bez realitky Hostýnská, Praha - Strašnice"
+        )
+
+        assert street == "Hostýnská"
+        assert city == "Praha"
+        assert district == "Strašnice"
+
+    def test_city_with_dash(self):
+        """Test that a dash inside the city name is not taken as the separator."""
+        street, city, district = parse_title_location(
+            "Prodej bytu 2+1 60 m² Národní, Frýdek-Místek - Místek"
+        )
+
+        assert street == "Národní"
+        assert city == "Frýdek-Místek"
+        assert district == "Místek"
+
+    def test_city_only(self):
+        """Test falling back to the city when the title has no district."""
+        assert parse_title_location("Prodej bytu 1+kk 30 m², Brno") == (None, "Brno", None)
+
+    def test_unknown_location(self):
+        """Test a title without a known city."""
+        assert parse_title_location("Prodej bytu 1+kk 30 m², Neznámé Město - Centrum") == (None, None, None)
+
+
+class TestDecodeHtml:
+    """Test decoding of fetched HTML documents."""
+
+    def test_header_charset(self):
+        """Test that the Content-Type charset is used."""
+        body = "<html><body><h1>Příliš</h1></body></html>".encode("cp1250")
+        assert "Příliš" in decode_html(body, "text/html; charset=windows-1250")
+
+    def test_meta_charset(self):
+        """Test that a <meta> declaration is used when the header has no charset."""
+        body = '<html><head><meta charset="iso-8859-2"></head><body>Příliš</body></html>'.encode("iso-8859-2")
+        assert "Příliš" in decode_html(body, "text/html")
+
+    def test_defaults_to_utf8(self):
+        """Test that undeclared and unknown charsets fall back to UTF-8."""
+        body = "<html><body>Příliš</body></html>".encode()
+        assert "Příliš" in decode_html(body)
+        assert "Příliš" in decode_html(body, "text/html; charset=no-such-charset")
+
+
+class TestExtractPropertyDataFromHtml:
+    """Test extraction from a whole listing page."""
+
+    def test_ignores_script_and_style_text(self):
+        """Test that embedded JSON and CSS don't contribute amenities or features."""
+        url = "https://www.bezrealitky.cz/nemovitosti-byty-domy/123456-nabidka-prodej-bytu"
+        page = """
+            <html><head><style>.Terasa { color: red }</style></head><body>
+            <h1>Prodej bytu 2+kk 50 m², Vinohradská, Praha - Vinohrady</h1>
+            <p>Byt má Balkon.</p>
+            <script id="__NEXT_DATA__">{"amenities": ["Terasa", "Bazén", "Garáž", "Výtah"],
+            "features": "Zahrada • Internet • Sklep"}</script>
+            </body></html>
+        """
+
+        data = extract_property_data_from_html(page, url, url)
+
+        assert data["amenities"] == ["Balkon"]
+        assert "features" not in data
+
+    def test_xml_declaration(self):
+        """Test that decoded XHTML with an encoding declaration is parsed."""
+        url = "https://www.bezrealitky.cz/nemovitosti-byty-domy/123456-nabidka-prodej-bytu"
+        page = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            "<html><body><h1>Prodej bytu 2+kk 50 m², Vinohradská, Praha - Vinohrady</h1></body></html>"
+        )
+
+        data = extract_property_data_from_html(page, url, url)
+
+        assert data["title"] == "Prodej bytu 2+kk 50 m², Vinohradská, Praha - Vinohrady"